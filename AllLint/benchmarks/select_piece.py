@@ -0,0 +1,123 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""
+Benchmark for move generation in GobbletRules.select_piece.
+
+Compares the current single-pass move generation against the previous
+implementation, which copied every board stack once per target square.
+
+To run the benchmark:
+    python3 -m benchmarks.select_piece
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from src.constants import RED, BLUE
+from src.enums import GameState
+from src.rules import GobbletRules
+
+def legacy_valid_moves(game, piece):
+    """
+    Previous move generation: one board copy and line scan per reserve target.
+    """
+    valid_moves = []
+    if piece.position is None:
+        for row in range(3):
+            for col in range(3):
+                if game.board.is_valid_move(piece, row, col):
+                    if not legacy_would_reveal_win(game, piece):
+                        valid_moves.append((row, col))
+    else:
+        for row in range(3):
+            for col in range(3):
+                if (row, col) != piece.position and game.board.is_valid_move(piece, row, col):
+                    valid_moves.append((row, col))
+    return valid_moves
+
+def current_valid_moves(game, piece):
+    """
+    Current move generation as used by select_piece.
+    """
+    return game._get_valid_moves(piece)  # pylint: disable=protected-access
+
+def legacy_would_reveal_win(game, piece):
+    """
+    Previous reveal check: copy every stack and rescan all eight lines.
+    """
+    temp_board = [[stack.copy() for stack in row] for row in game.board.grid]
+    opponent_color = BLUE if piece.color == RED else RED
+    lines = ([[(row, col) for col in range(3)] for row in range(3)] +
+             [[(row, col) for row in range(3)] for col in range(3)] +
+             [[(i, i) for i in range(3)], [(i, 2 - i) for i in range(3)]])
+    for line in lines:
+        if all(temp_board[row][col] and temp_board[row][col][-1].color == opponent_color
+               for row, col in line):
+            return True
+    return False
+
+def selectable_pieces(game):
+    """
+    Get every piece the current player could select.
+    """
+    player = game.get_current_player()
+    pieces = list(player.reserve)
+    for row in range(3):
+        for col in range(3):
+            piece = game.board.get_top_piece(row, col)
+            if piece and piece.color == player.color:
+                pieces.append(piece)
+    return pieces
+
+def measure(move_generator, game, pieces, totals):
+    """
+    Accumulate time and traced allocation volume for one position.
+    """
+    start = time.perf_counter()
+    for piece in pieces:
+        move_generator(game, piece)
+    totals[0] += time.perf_counter() - start
+
+    tracemalloc.start()
+    for piece in pieces:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        move_generator(game, piece)
+        totals[1] += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+def main():
+    """
+    Main entry point function.
+    """
+    rng = random.Random(1)
+    legacy_totals = [0.0, 0]
+    current_totals = [0.0, 0]
+    calls = 0
+
+    # Measure every selectable piece along a set of random games
+    for _ in range(200):
+        game = GobbletRules()
+        while game.current_state in (GameState.PLAYER_RED, GameState.PLAYER_BLUE):
+            pieces = selectable_pieces(game)
+            for piece in pieces:
+                assert legacy_valid_moves(game, piece) == current_valid_moves(game, piece)
+            measure(legacy_valid_moves, game, pieces, legacy_totals)
+            measure(current_valid_moves, game, pieces, current_totals)
+            calls += len(pieces)
+
+            game.select_piece(rng.choice(pieces))
+            if not game.valid_moves:
+                break
+            game.make_move(*rng.choice(game.valid_moves))
+
+    print(f"{calls} selections")
+    for label, (elapsed, allocated) in (("legacy", legacy_totals),
+                                        ("current", current_totals)):
+        print(f"{label:<10} {elapsed / calls * 1e6:8.2f} us/call "
+              f"{allocated / calls:10.1f} peak bytes/call")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""
+Benchmark for game startup: time to first frame and import time per module.
+
+Launches gobbletfinal.py in fresh interpreters, without a window unless
+SDL_VIDEODRIVER is set, and reports the median time from launch until its
+modules are imported and until the first frame reaches the display. Import
+times come from python -X importtime. Arguments it does not know are passed
+on to the game.
+
+To run the benchmark:
+    python3 -m benchmarks.startup
+    python3 -m benchmarks.startup --runs 20 --ai blue
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Directory holding gobbletfinal.py
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run in the launched interpreter: report when the imports finish and when the
+# first frame is shown, then quit the game through its event queue
+FIRST_FRAME_PROBE = """
+import sys
+import time
+import gobbletfinal
+import pygame
+
+imported = time.time()
+display_update = pygame.display.update
+
+def first_update(*args):
+    display_update(*args)
+    if pygame.display.update is first_update:
+        pygame.display.update = display_update
+        print(imported, time.time(), flush=True)
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+pygame.display.update = first_update
+gobbletfinal.main(sys.argv[1:])
+"""
+
+def parse_args(argv):
+    """
+    Parse command-line arguments; unknown ones are the game's arguments.
+    """
+    parser = argparse.ArgumentParser(description="Gobblet Jr. startup benchmark")
+    parser.add_argument("--runs", type=int, default=10,
+                        help="launches to take the median of")
+    parser.add_argument("--modules", type=int, default=15,
+                        help="slowest modules to list")
+    return parser.parse_known_args(argv)
+
+def child_env():
+    """
+    Get the environment for launched games: no window and no pygame banner by default.
+    """
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    return env
+
+def time_first_frame(game_args):
+    """
+    Launch the game once; returns seconds from launch to imports done and to first frame.
+    """
+    launched = time.time()
+    result = subprocess.run([sys.executable, "-c", FIRST_FRAME_PROBE] + game_args,
+                            cwd=GAME_DIR, env=child_env(), capture_output=True,
+                            text=True, check=True)
+    imported, first_frame = (float(value) for value in result.stdout.split()[-2:])
+    return imported - launched, first_frame - launched
+
+def import_times():
+    """
+    Get (cumulative us, self us, module) for every module gobbletfinal imports.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import gobbletfinal"],
+                            cwd=GAME_DIR, env=child_env(), capture_output=True,
+                            text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+    return rows
+
+def main(argv=None):
+    """
+    Main entry point function.
+    """
+    args, game_args = parse_args(argv)
+
+    # Time to first frame, median over fresh launches
+    imported = []
+    first_frames = []
+    for _ in range(args.runs):
+        import_seconds, first_frame_seconds = time_first_frame(game_args)
+        imported.append(import_seconds)
+        first_frames.append(first_frame_seconds)
+    print(f"{args.runs} launches of gobbletfinal.py {' '.join(game_args)}")
+    print(f"{'imports done':<24} {statistics.median(imported) * 1000:8.1f} ms")
+    print(f"{'first frame':<24} {statistics.median(first_frames) * 1000:8.1f} ms")
+    setup = [first - done for first, done in zip(first_frames, imported)]
+    print(f"{'imports to first frame':<24} {statistics.median(setup) * 1000:8.1f} ms")
+
+    # Import time of each module, slowest first
+    rows = import_times()
+    print()
+    print(f"{'module':<40} {'cumulative':>10} {'self':>8} (ms)")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:args.modules]:
+        print(f"{name:<40} {cumulative_us / 1000:10.1f} {self_us / 1000:8.1f}")
+    project_us = sum(self_us for _, self_us, name in rows
+                     if name == "gobbletfinal" or name.startswith("src"))
+    print(f"{'game modules (self)':<40} {project_us / 1000:10.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,28 +9,99 @@ on a 3x3 grid, with the goal of creating a line of their colored pieces.
 
 To run the game:
     python3 gobblet.py
+
+To play against the computer:
+    python3 gobblet.py --ai blue
+
+To show frame-time percentiles and log every frame's stage times:
+    python3 gobblet.py --profile --profile-csv frames.csv
 """
 
+import argparse
 import sys
 import pygame
+from src.constants import RED, BLUE, AI_TIME_BUDGET
 from src.game import GobbletJr
+from src.ui.frame_profiler import FrameProfiler
+from src.ui.fonts import FONTS
+
+def parse_args(argv):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Gobblet Jr. board game")
+    parser.add_argument("--ai", choices=["red", "blue"],
+                        help="color played by the computer")
+    parser.add_argument("--ai-time", type=float, default=AI_TIME_BUDGET,
+                        help="computer search budget per move in seconds")
+    parser.add_argument("--engine", choices=["alphabeta", "mcts"], default="alphabeta",
+                        help="search used by the computer player")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes for the mcts engine")
+    parser.add_argument("--book",
+                        help="opening book consulted by the computer before searching")
+    parser.add_argument("--font",
+                        help="font file for all text instead of pygame's built-in font")
+    parser.add_argument("--profile", action="store_true",
+                        help="show frame-time percentiles per stage on screen")
+    parser.add_argument("--profile-csv",
+                        help="write every frame's stage times to this CSV file")
+    return parser.parse_args(argv)
 
-def main():
+def create_ai_player(args):
+    """
+    Create the computer player, importing only the search it uses.
+    The search modules are loaded here rather than at startup, so a game
+    without a computer player never pays for them.
+    """
+    # pylint: disable=import-outside-toplevel
+    from src.ai.background import BackgroundPlayer
+
+    ai_color = RED if args.ai == "red" else BLUE
+    book = None
+    if args.book:
+        from src.ai.book import OpeningBook
+        book = OpeningBook(args.book)
+    if args.engine == "mcts":
+        from src.ai.mcts import MCTSPlayer
+        search_player = MCTSPlayer(ai_color, args.ai_time, workers=args.workers, book=book)
+    else:
+        from src.ai.alpha_beta import AlphaBetaPlayer
+        search_player = AlphaBetaPlayer(ai_color, args.ai_time, book=book)
+    # Search in a worker process so the window keeps drawing
+    return BackgroundPlayer(search_player)
+
+def main(argv=None):
     """
     Main entry point function.
     """
-    # Initialize pygame
-    pygame.init()
+    args = parse_args(argv)
+    ai_player = create_ai_player(args) if args.ai else None
+
+    # Initialize only the pygame modules the game uses; the mixer, joystick
+    # and other subsystems are never started
+    pygame.display.init()
+    pygame.font.init()
+    if args.font:
+        FONTS.set_font_file(args.font)
+
+    profiler = None
+    if args.profile or args.profile_csv:
+        profiler = FrameProfiler(overlay=args.profile, csv_path=args.profile_csv)
 
     try:
         # Create and run the game
-        game = GobbletJr()
+        game = GobbletJr(ai_player, profiler)
         game.run()
     except Exception as exception:  # pylint: disable=broad-except
         print(f"An error occurred: {exception}")
         return 1
     finally:
-        # Clean up pygame
+        # Clean up the computer player's workers, the profiler and pygame
+        if ai_player is not None:
+            ai_player.close()
+        if profiler is not None:
+            profiler.close()
         pygame.quit()
 
     return 0
@@ -0,0 +1,354 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-instance-attributes
+# pylint: disable=too-many-locals
+# pylint: disable=too-few-public-methods
+"""Alpha-beta computer player for the Gobblet Jr. game."""
+import time
+from ..constants import BOARD_SIZE
+from ..enums import GameState
+from ..bitboard import (COLOR_INDEX, PLAYER_COLORS, NUM_SIZES, NUM_CELLS, LINE_MASKS,
+                        generate_moves, play_move, outcome, visible_mask, reserve_count)
+from ..zobrist import PIECE_KEYS, RESERVE_KEYS, SIDE_KEY
+from .turn import play_search_move
+
+# Score of a won position; wins found sooner score higher
+WIN_SCORE = 100000
+MATE_THRESHOLD = WIN_SCORE - 1000
+
+# Transposition table entry bounds
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# Nodes searched between wall-clock checks
+TIME_CHECK_INTERVAL = 256
+
+# Zobrist keys indexed by (color index, cell, size) for the search
+_PIECE_KEYS = [[[PIECE_KEYS[color][cell // BOARD_SIZE][cell % BOARD_SIZE][size]
+                 for size in range(NUM_SIZES)] for cell in range(NUM_CELLS)]
+               for color in PLAYER_COLORS]
+_RESERVE_KEYS = [RESERVE_KEYS[color] for color in PLAYER_COLORS]
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the time budget runs out.
+    """
+
+
+class SearchStats:
+    """
+    Statistics of the most recent search, for tuning.
+    """
+    def __init__(self):
+        """
+        Initialize empty statistics.
+        """
+        self.depth = 0
+        self.nodes = 0
+        self.tt_hits = 0
+        self.elapsed = 0.0
+        self.score = 0
+
+    def nodes_per_second(self):
+        """
+        Get the search speed in nodes per second.
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return self.nodes / self.elapsed
+
+
+def layers_key(layers, color_index):
+    """
+    Get the Zobrist key of a position from scratch, matching GobbletRules.position_hash.
+    """
+    key = SIDE_KEY if color_index == 1 else 0
+    for index, layer in enumerate(layers):
+        layer_color, size = divmod(index, NUM_SIZES)
+        for cell in range(NUM_CELLS):
+            if layer >> cell & 1:
+                key ^= _PIECE_KEYS[layer_color][cell][size]
+        key ^= _RESERVE_KEYS[layer_color][size][reserve_count(layers, layer_color, size)]
+    return key
+
+
+def move_key(position_key, color_index, layers, move):
+    """
+    Get the Zobrist key of the position after a move.
+    """
+    size, from_cell, to_cell = move
+    key = position_key ^ SIDE_KEY ^ _PIECE_KEYS[color_index][to_cell][size]
+    if from_cell is None:
+        count = reserve_count(layers, color_index, size)
+        key ^= _RESERVE_KEYS[color_index][size][count] ^ _RESERVE_KEYS[color_index][size][count - 1]
+    else:
+        key ^= _PIECE_KEYS[color_index][from_cell][size]
+    return key
+
+
+def evaluate(layers, color_index):
+    """
+    Score a position from the point of view of the given color.
+    Lines only one color can still see count for that color.
+    """
+    own = visible_mask(layers, color_index)
+    other = visible_mask(layers, 1 - color_index)
+    score = 0
+    for line in LINE_MASKS:
+        own_count = (own & line).bit_count()
+        other_count = (other & line).bit_count()
+        if not other_count:
+            score += own_count * own_count
+        elif not own_count:
+            score -= other_count * other_count
+    # Large pieces still in reserve can cover anything later
+    score += 2 * (reserve_count(layers, color_index, NUM_SIZES - 1) -
+                  reserve_count(layers, 1 - color_index, NUM_SIZES - 1))
+    return score
+
+
+def terminal_score(state, color_index, ply):
+    """
+    Score a finished game from the point of view of the color that just moved.
+    """
+    if state == GameState.DRAW:
+        return 0
+    winner = 0 if state == GameState.RED_WIN else 1
+    if winner == color_index:
+        return WIN_SCORE - ply
+    return -(WIN_SCORE - ply)
+
+
+class AlphaBetaPlayer:
+    """
+    Computer player using iterative-deepening alpha-beta search.
+    Keeps a Zobrist-keyed transposition table between moves and always returns
+    the best move found within its wall-clock budget. Positions in the optional
+    opening book are answered from the book without searching.
+    """
+    def __init__(self, color, time_budget, max_depth=64, table_size=1 << 20, book=None):
+        """
+        Initialize the computer player.
+        """
+        self.color = color
+        self.book = book
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.table_size = table_size
+        self.table = {}
+        self.stats = SearchStats()
+        self.stop_event = None  # Event that ends the search early when set
+        self._pondered = None  # (layers, move, seconds) searched while pondering
+        self._deadline = 0.0
+
+    def take_turn(self, game):
+        """
+        Search the game's position and play the chosen move through the turn flow.
+        """
+        if game.get_current_player().color != self.color:
+            return False
+        move = self.choose_move(tuple(game.board.layers), game.position_hash())
+        if move is None:
+            return False
+        return play_search_move(game, move)
+
+    def choose_move(self, layers, position_key=None):
+        """
+        Get the best move for this player's color within the time budget.
+        The position's Zobrist key is computed from the layers when not given.
+        """
+        if self.book is not None:
+            move = self.book.move(layers, COLOR_INDEX[self.color])
+            if move is not None:
+                return move
+
+        time_budget = self.time_budget
+        pondered, self._pondered = self._pondered, None
+        if pondered is not None and pondered[0] == layers:
+            # The opponent played the predicted reply: pondering time counts
+            # towards this move, and a full budget's search answers at once
+            _, move, elapsed = pondered
+            if elapsed >= time_budget:
+                return move
+            time_budget -= elapsed
+        return self._deepen(layers, COLOR_INDEX[self.color], position_key, time_budget)
+
+    def ponder(self, layers, time_limit, position_key=None):
+        """
+        Search ahead while the opponent is to move in the given position.
+        The opponent's likely reply is found with a normal-length search, then
+        the position after it is searched until time_limit, the stop event or a
+        forced result, so choose_move can answer at once if that reply is played.
+        """
+        start = time.perf_counter()
+        self._pondered = None
+        opponent_index = 1 - COLOR_INDEX[self.color]
+        reply = self._deepen(layers, opponent_index, position_key,
+                             min(self.time_budget, time_limit))
+        if reply is None or self._stopped():
+            return
+        predicted = play_move(layers, opponent_index, reply)
+        if outcome(predicted) is not None:
+            return
+        move = self._deepen(predicted, COLOR_INDEX[self.color], None,
+                            time_limit - (time.perf_counter() - start))
+        if move is not None:
+            self._pondered = (predicted, move, self.stats.elapsed)
+
+    def _stopped(self):
+        """
+        Check if the stop event has been set.
+        """
+        return self.stop_event is not None and self.stop_event.is_set()
+
+    def _deepen(self, layers, color_index, position_key, time_budget):
+        """
+        Search a position with iterative deepening and get the best move found.
+        """
+        start = time.perf_counter()
+        self._deadline = start + time_budget
+        self.stats = SearchStats()
+        if position_key is None:
+            position_key = layers_key(layers, color_index)
+
+        moves = generate_moves(layers, color_index)
+        if not moves:
+            return None
+        best_move = moves[0]
+
+        if len(self.table) > self.table_size:
+            self.table.clear()
+
+        # Deepen until the budget runs out; keep the last completed result
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score, move = self._search_root(layers, color_index, position_key, depth, moves)
+            except SearchTimeout:
+                break
+            best_move = move
+            self.stats.depth = depth
+            self.stats.score = score
+            if abs(score) >= MATE_THRESHOLD or len(self.table) > self.table_size:
+                break
+            # Search the previous best move first at the next depth
+            moves.remove(move)
+            moves.insert(0, move)
+
+        self.stats.elapsed = time.perf_counter() - start
+        return best_move
+
+    def close(self):
+        """
+        Release search resources; the transposition table is kept in memory.
+        """
+
+    def _search_root(self, layers, color_index, position_key, depth, moves):
+        """
+        Search every root move to the given depth.
+        """
+        alpha = -WIN_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            score = self._score_move(layers, color_index, position_key, move, depth,
+                                     -WIN_SCORE - 1, -alpha, 1)
+            if score > alpha:
+                alpha = score
+                best_move = move
+        return alpha, best_move
+
+    def _score_move(self, layers, color_index, position_key, move, depth, alpha, beta, ply):
+        """
+        Score a move for the color making it, given the opponent's window.
+        """
+        child = play_move(layers, color_index, move)
+        state = outcome(child)
+        if state is not None:
+            return terminal_score(state, color_index, ply)
+        child_key = move_key(position_key, color_index, layers, move)
+        return -self._negamax(child, 1 - color_index, child_key, depth - 1, alpha, beta, ply)
+
+    def _negamax(self, layers, color_index, position_key, depth, alpha, beta, ply):
+        """
+        Alpha-beta search of a position from the point of view of the color to move.
+        """
+        self.stats.nodes += 1
+        if self.stats.nodes % TIME_CHECK_INTERVAL == 0 and (
+                time.perf_counter() > self._deadline or self._stopped()):
+            raise SearchTimeout()
+
+        if depth <= 0:
+            return evaluate(layers, color_index)
+
+        # Probe the transposition table
+        original_alpha = alpha
+        tt_move = None
+        entry = self.table.get(position_key)
+        if entry:
+            entry_depth, entry_score, entry_flag, tt_move = entry
+            if entry_depth >= depth:
+                self.stats.tt_hits += 1
+                entry_score = _score_from_table(entry_score, ply)
+                if entry_flag == EXACT:
+                    return entry_score
+                if entry_flag == LOWER_BOUND:
+                    alpha = max(alpha, entry_score)
+                elif entry_flag == UPPER_BOUND:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+
+        moves = generate_moves(layers, color_index)
+        if not moves:
+            # No rule covers a player without moves; the game cannot continue
+            return 0
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+
+        best_score = -WIN_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            score = self._score_move(layers, color_index, position_key, move, depth,
+                                     -beta, -alpha, ply + 1)
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        # Store the result
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table[position_key] = (depth, _score_to_table(best_score, ply), flag, best_move)
+        return best_score
+
+
+def _score_to_table(score, ply):
+    """
+    Make a win score relative to the stored position instead of the root.
+    """
+    if score >= MATE_THRESHOLD:
+        return score + ply
+    if score <= -MATE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_table(score, ply):
+    """
+    Make a stored win score relative to the root again.
+    """
+    if score >= MATE_THRESHOLD:
+        return score - ply
+    if score <= -MATE_THRESHOLD:
+        return score + ply
+    return score
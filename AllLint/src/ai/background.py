@@ -0,0 +1,181 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+# pylint: disable=too-few-public-methods
+"""Background searching for computer players in the Gobblet Jr. game."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from .turn import play_search_move
+
+# Player owned by the worker process; it keeps its search tables between moves
+_WORKER_PLAYER = None
+
+# Shared counter of the newest cancelled task, set by the main process
+_WORKER_CANCELLED = None
+
+# Longest a ponder search runs while the opponent thinks, in seconds
+PONDER_TIME_LIMIT = 30.0
+
+
+class StopToken:
+    """
+    Stop signal of one worker task, read by the player's search like an Event.
+    The task is stopped once the main process has cancelled its generation or
+    a later one, so a task cancelled before it starts stops at once, and a
+    cancellation never carries over to the tasks submitted after it.
+    """
+    def __init__(self, cancelled, generation):
+        """
+        Initialize the token for the task of a generation.
+        """
+        self.cancelled = cancelled
+        self.generation = generation
+
+    def is_set(self):
+        """
+        Check if the task has been cancelled.
+        """
+        return self.cancelled.value >= self.generation
+
+
+def _start_worker(player, cancelled):
+    """
+    Set up the worker process with its own copy of the player.
+    """
+    global _WORKER_PLAYER, _WORKER_CANCELLED  # pylint: disable=global-statement
+    _WORKER_PLAYER = player
+    _WORKER_CANCELLED = cancelled
+
+
+def _search_move(layers, generation):
+    """
+    Choose a move for the position in the worker process.
+    """
+    _WORKER_PLAYER.stop_event = StopToken(_WORKER_CANCELLED, generation)
+    return _WORKER_PLAYER.choose_move(layers)
+
+
+def _ponder(layers, generation):
+    """
+    Search the opponent's position in the worker process until stopped.
+    """
+    _WORKER_PLAYER.stop_event = StopToken(_WORKER_CANCELLED, generation)
+    _WORKER_PLAYER.ponder(layers, PONDER_TIME_LIMIT)
+
+
+def _wake_worker():
+    """
+    Do nothing; submitting this starts the worker process.
+    """
+
+
+def _close_worker():
+    """
+    Release the worker player's resources, such as its own process pool.
+    """
+    _WORKER_PLAYER.close()
+
+
+class BackgroundPlayer:
+    """
+    Runs a computer player's search in a worker process.
+    take_turn never blocks: it starts a search, then plays the move once the
+    search future is done, so the main loop keeps drawing frames meanwhile.
+    During the opponent's turn the worker ponders, filling the same tables
+    the next search will use.
+    """
+    def __init__(self, player):
+        """
+        Initialize the background player around an AlphaBetaPlayer or MCTSPlayer.
+        """
+        self.color = player.color
+        # Start the worker from a clean server process, not a fork of this one,
+        # so players can run their own process pools inside it; where there is
+        # no fork server, as on Windows, spawn is just as clean
+        start_method = ("forkserver" if "forkserver" in multiprocessing.get_all_start_methods()
+                        else "spawn")
+        context = multiprocessing.get_context(start_method)
+        # Tasks are numbered; cancelling sets this to the running task's number
+        self._cancelled = context.RawValue("q", 0)
+        self._generation = 0
+        self._executor = ProcessPoolExecutor(max_workers=1, mp_context=context,
+                                             initializer=_start_worker,
+                                             initargs=(player, self._cancelled))
+        self._future = None
+        self._layers = None
+        self._pondering = False
+
+    def start(self):
+        """
+        Start the worker process, which blocks while its interpreter launches.
+        Called once the first frame is shown; starting it on the first turn
+        instead would stall that turn's frame.
+        """
+        self._executor.submit(_wake_worker)
+
+    def is_thinking(self):
+        """
+        Check if a search for this player's move is running.
+        """
+        return self._future is not None and not self._pondering
+
+    def ponder(self, game):
+        """
+        Start pondering the game's position while the opponent is to move.
+        """
+        if game.get_current_player().color == self.color:
+            return
+        layers = tuple(game.board.layers)
+        if self._future is not None:
+            if self._pondering and layers == self._layers:
+                return
+            self.cancel()
+        self._layers = layers
+        self._pondering = True
+        self._generation += 1
+        self._future = self._executor.submit(_ponder, layers, self._generation)
+
+    def take_turn(self, game):
+        """
+        Start a search for the game's position, or play its move when it is done.
+        Returns True once a move has been played.
+        """
+        if game.get_current_player().color != self.color:
+            return False
+        layers = tuple(game.board.layers)
+
+        # Pondering, or a search for another position, gives way to this search
+        if self._future is not None and (self._pondering or layers != self._layers):
+            self.cancel()
+
+        if self._future is None:
+            self._layers = layers
+            self._generation += 1
+            self._future = self._executor.submit(_search_move, layers, self._generation)
+            return False
+        if not self._future.done():
+            return False
+
+        move = self._future.result()
+        self._future = None
+        if move is None:
+            return False
+        return play_search_move(game, move)
+
+    def cancel(self):
+        """
+        Stop the running search and drop its result.
+        A search still queued behind another one is removed without running.
+        """
+        if self._future is not None:
+            self._future.cancel()
+            self._cancelled.value = self._generation
+            self._future = None
+            self._pondering = False
+
+    def close(self):
+        """
+        Stop any search and shut down the worker process.
+        """
+        self.cancel()
+        self._executor.submit(_close_worker)
+        self._executor.shutdown()
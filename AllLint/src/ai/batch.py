@@ -0,0 +1,231 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-locals
+"""
+Vectorized batch simulator for many Gobblet Jr. games at once.
+
+Holds every game as rows of NumPy arrays (board layers, side to move, game
+state) and generates, applies and scores moves for the whole batch with array
+operations. Follows the same rules as GobbletRules and src/bitboard.py.
+Requires NumPy, which the rest of the game does not need.
+"""
+
+import numpy as np
+from ..constants import RESERVE_COUNT
+from ..bitboard import NUM_SIZES, NUM_CELLS, FULL_MASK, LINE_MASKS
+
+# Move ids are source * NUM_CELLS + destination. Sources 0-2 are reserve
+# pieces of that size; sources 3-11 are board cells 0-8.
+NUM_SOURCES = NUM_SIZES + NUM_CELLS
+NUM_MOVES = NUM_SOURCES * NUM_CELLS
+
+# Game states
+ONGOING = 0
+RED_WIN = 1
+BLUE_WIN = 2
+DRAW = 3
+
+_CELL_BITS = (1 << np.arange(NUM_CELLS)).astype(np.int16)
+_LINES = np.array(LINE_MASKS, dtype=np.int16)
+_POPCOUNT = np.array([mask.bit_count() for mask in range(FULL_MASK + 1)], dtype=np.int8)
+
+# Cell of the n-th set bit of every mask
+_NTH_BIT = np.zeros((FULL_MASK + 1, NUM_CELLS), dtype=np.int64)
+for _mask in range(FULL_MASK + 1):
+    _bits = [cell for cell in range(NUM_CELLS) if _mask >> cell & 1]
+    _NTH_BIT[_mask, :len(_bits)] = _bits
+
+
+def _has_line(masks):
+    """
+    Check each mask for a complete row, column or diagonal.
+    """
+    return ((masks[:, None] & _LINES) == _LINES).any(axis=1)
+
+
+def _cell_flags(masks):
+    """
+    Expand masks of shape (N,) into booleans of shape (N, 9).
+    """
+    return (masks[:, None] & _CELL_BITS) != 0
+
+
+class BatchGames:
+    """
+    A batch of independent games advanced together.
+    """
+    def __init__(self, count, seed=None):
+        """
+        Initialize a batch of games at the starting position.
+        """
+        self.count = count
+        self.rng = np.random.default_rng(seed)
+        self.layers = np.zeros((count, 2 * NUM_SIZES), dtype=np.int16)
+        self.side = np.zeros(count, dtype=np.int8)
+        self.state = np.zeros(count, dtype=np.int8)
+        self.plies = np.zeros(count, dtype=np.int32)
+
+    def reset(self):
+        """
+        Return every game to the starting position.
+        """
+        self.layers[:] = 0
+        self.side[:] = 0
+        self.state[:] = ONGOING
+        self.plies[:] = 0
+
+    def _own_and_other(self, layers, side):
+        """
+        Split layers into those of the color to move and of its opponent, each (N, 3).
+        """
+        red = layers[:, :NUM_SIZES]
+        blue = layers[:, NUM_SIZES:]
+        blue_to_move = (side == 1)[:, None]
+        return np.where(blue_to_move, blue, red), np.where(blue_to_move, red, blue)
+
+    @staticmethod
+    def _cover_masks(layers):
+        """
+        Get, for each size, the squares holding an equal or larger piece, (N, 3).
+        """
+        occupied = layers[:, :NUM_SIZES] | layers[:, NUM_SIZES:]
+        return np.bitwise_or.accumulate(occupied[:, ::-1], axis=1)[:, ::-1]
+
+    @staticmethod
+    def _visible(layers, cover):
+        """
+        Get the squares where one color's piece is on top, (N,).
+        """
+        return (layers[:, 2] |
+                (layers[:, 1] & ~cover[:, 2]) |
+                (layers[:, 0] & ~cover[:, 1]))
+
+    @staticmethod
+    def _top_sizes(cover):
+        """
+        Get the size of the top piece on every square, -1 when empty, (N, 9).
+        """
+        return _cell_flags(cover[:, 0]).astype(np.int8) + (
+            _cell_flags(cover[:, 1]).astype(np.int8) +
+            _cell_flags(cover[:, 2]).astype(np.int8)) - 1
+
+    def _source_targets(self, rows):
+        """
+        Get, for each move source, the mask of squares it can move to, (len(rows), 12).
+        """
+        layers = self.layers[rows]
+        own, other = self._own_and_other(layers, self.side[rows])
+        cover = self._cover_masks(layers)
+        targets = FULL_MASK & ~cover
+
+        # Reserve placements, unless the opponent already shows a line
+        can_place = ((_POPCOUNT[own] < RESERVE_COUNT) &
+                     ~_has_line(self._visible(other, cover))[:, None])
+        reserve = np.where(can_place, targets, 0)
+
+        # Moves of top pieces already on the board, to any other open square
+        movable = _cell_flags(self._visible(own, cover))
+        top = self._top_sizes(cover)
+        cell_targets = np.take_along_axis(targets, np.maximum(top, 0), axis=1) & ~_CELL_BITS
+        board = np.where(movable, cell_targets, 0)
+
+        return np.concatenate((reserve, board), axis=1)
+
+    def legal_moves(self):
+        """
+        Get a (N, 108) boolean array of legal move ids for every ongoing game.
+        """
+        legal = np.zeros((self.count, NUM_SOURCES, NUM_CELLS), dtype=bool)
+        rows = np.nonzero(self.state == ONGOING)[0]
+        legal[rows] = (self._source_targets(rows)[:, :, None] & _CELL_BITS) != 0
+        return legal.reshape(self.count, NUM_MOVES)
+
+    def apply_moves(self, moves):
+        """
+        Play one move id per game; games given a negative id are left alone.
+        """
+        rows = np.nonzero((moves >= 0) & (self.state == ONGOING))[0]
+        self._apply_moves(rows, moves[rows])
+
+    def _apply_moves(self, rows, moves):
+        """
+        Play the given move ids in the given ongoing games.
+        """
+        source, destination = np.divmod(moves, NUM_CELLS)
+        from_reserve = source < NUM_SIZES
+        from_cell = np.where(from_reserve, 0, source - NUM_SIZES)
+
+        # The moving piece's size is the reserve slot or the top of its square
+        top = self._top_sizes(self._cover_masks(self.layers[rows]))
+        size = np.where(from_reserve, source, top[np.arange(rows.size), from_cell])
+        layer = self.side[rows] * NUM_SIZES + size
+
+        from_bit = np.where(from_reserve, 0, 1 << from_cell)
+        self.layers[rows, layer] = (self.layers[rows, layer] & ~from_bit) | (1 << destination)
+        self.plies[rows] += 1
+        self._update_state(rows)
+
+    def _update_state(self, rows):
+        """
+        Score the games that just moved and pass the turn in the rest.
+        Red is checked before blue, matching GobbletRules.make_move.
+        """
+        layers = self.layers[rows]
+        cover = self._cover_masks(layers)
+        red_line = _has_line(self._visible(layers[:, :NUM_SIZES], cover))
+        blue_line = _has_line(self._visible(layers[:, NUM_SIZES:], cover))
+        full = cover[:, 0] == FULL_MASK
+
+        state = np.full(rows.size, ONGOING, dtype=np.int8)
+        state[full] = DRAW
+        state[blue_line] = BLUE_WIN
+        state[red_line] = RED_WIN
+        self.state[rows] = state
+        self.side[rows[state == ONGOING]] ^= 1
+
+    def step_random(self):
+        """
+        Play one uniformly random legal move in every ongoing game.
+        Games without a legal move are scored as draws.
+        Returns the number of moves played.
+        """
+        rows = np.nonzero(self.state == ONGOING)[0]
+        targets = self._source_targets(rows)
+        counts = _POPCOUNT[targets]
+        totals = counts.sum(axis=1, dtype=np.int16)
+        stuck = totals == 0
+        self.state[rows[stuck]] = DRAW
+        playing = ~stuck
+        rows, targets, counts, totals = (rows[playing], targets[playing], counts[playing],
+                                         totals[playing])
+
+        # Pick the k-th legal move with k uniform over each game's legal moves:
+        # first the source holding it, then the matching destination bit
+        choice = (self.rng.random(rows.size) * totals).astype(np.int16)
+        before = counts.cumsum(axis=1, dtype=np.int16)
+        source = (before > choice[:, None]).argmax(axis=1)
+        index = np.arange(rows.size)
+        within = choice - before[index, source] + counts[index, source]
+        destination = _NTH_BIT[targets[index, source], within]
+
+        self._apply_moves(rows, source * NUM_CELLS + destination)
+        return int(rows.size)
+
+    def play_random(self, max_plies=100):
+        """
+        Play random games to the end; unfinished games after max_plies are draws.
+        Returns the number of moves played.
+        """
+        total = 0
+        for _ in range(max_plies):
+            if not (self.state == ONGOING).any():
+                break
+            total += self.step_random()
+        self.state[self.state == ONGOING] = DRAW
+        return total
+
+    def game_layers(self, index):
+        """
+        Get one game's layers as a tuple, in the layout used by src/bitboard.py.
+        """
+        return tuple(int(layer) for layer in self.layers[index])
@@ -0,0 +1,107 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""
+Opening book for the Gobblet Jr. game.
+
+Maps the positions of the first few plies to a chosen move. Positions are
+stored once per symmetry class, keyed by the position number of their
+canonical form, with the move given in that canonical frame. Built by
+src/ai/book_builder.py.
+"""
+
+import struct
+from ..bitboard import COLOR_INDEX
+from ..symmetry import canonicalize, transform_move, untransform_move
+from .position_index import position_index
+
+# Book file header: magic, format version, number of entries
+BOOK_MAGIC = b"GJRB"
+BOOK_VERSION = 1
+BOOK_HEADER = struct.Struct("<4sII")
+
+# Book entry: canonical position number, packed move
+BOOK_ENTRY = struct.Struct("<QH")
+
+# Source field of a packed move placing a piece from the reserve
+RESERVE_SOURCE = 15
+
+
+def pack_move(move):
+    """
+    Pack a (size, from_cell, to_cell) move into 10 bits.
+    """
+    size, from_cell, to_cell = move
+    source = RESERVE_SOURCE if from_cell is None else from_cell
+    return (size << 8) | (source << 4) | to_cell
+
+
+def unpack_move(packed):
+    """
+    Unpack a move packed by pack_move.
+    """
+    source = (packed >> 4) & 15
+    return packed >> 8, None if source == RESERVE_SOURCE else source, packed & 15
+
+
+def book_key(layers, color_index):
+    """
+    Get the book key of a position and the transform to its canonical form.
+    """
+    canonical, transform = canonicalize(layers)
+    return position_index(canonical, color_index), transform
+
+
+def add_book_move(moves, layers, color_index, move):
+    """
+    Record a move for a position in a {key: packed move} dict, in canonical form.
+    """
+    key, transform = book_key(layers, color_index)
+    moves[key] = pack_move(transform_move(move, transform))
+
+
+def write_book(moves, path):
+    """
+    Write a {key: packed move} dict as a book file, sorted by key.
+    """
+    with open(path, "wb") as book_file:
+        book_file.write(BOOK_HEADER.pack(BOOK_MAGIC, BOOK_VERSION, len(moves)))
+        for key in sorted(moves):
+            book_file.write(BOOK_ENTRY.pack(key, moves[key]))
+
+
+class OpeningBook:
+    """
+    Opening book loaded into memory; lookups cost one canonicalization and a dict probe.
+    """
+    def __init__(self, path):
+        """
+        Load an opening book file.
+        """
+        with open(path, "rb") as book_file:
+            magic, version, count = BOOK_HEADER.unpack(book_file.read(BOOK_HEADER.size))
+            if magic != BOOK_MAGIC or version != BOOK_VERSION:
+                raise ValueError(f"{path} is not a Gobblet Jr. opening book")
+            data = book_file.read(count * BOOK_ENTRY.size)
+        self.moves = dict(BOOK_ENTRY.iter_unpack(data))
+
+    def __len__(self):
+        """
+        Get the number of book positions.
+        """
+        return len(self.moves)
+
+    def move(self, layers, color_index):
+        """
+        Get the book move for a position, or None when it is out of book.
+        """
+        key, transform = book_key(layers, color_index)
+        packed = self.moves.get(key)
+        if packed is None:
+            return None
+        return untransform_move(unpack_move(packed), transform)
+
+    def game_move(self, game):
+        """
+        Get the book move for a game's current position.
+        """
+        return self.move(game.board.layers, COLOR_INDEX[game.get_current_player().color])
@@ -0,0 +1,222 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-locals
+"""
+Opening book builder for the Gobblet Jr. game.
+
+Builds a book either from a solved-position table, taking its best move in
+every opening position, or from self-play games, taking the move with the
+best average result. Self-play games open with random moves and continue
+with a computer player, so every opening move gets sampled; the games can
+be kept in a log and aggregated again by later runs.
+
+To build a book from self-play:
+    python3 -m src.ai.book_builder opening.book --games 2000 --log selfplay.log
+
+To build a book from solver output:
+    python3 -m src.ai.book_builder opening.book --table gobblet_solved.bin
+"""
+
+import argparse
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ..constants import RED, BLUE
+from ..enums import GameState
+from ..bitboard import generate_moves, play_move, outcome
+from ..symmetry import canonicalize, transform_move
+from .book import book_key, pack_move, add_book_move, write_book
+from .players import create_player
+from .solver import MappedResultTable, best_move
+from .tournament import MAX_GAME_PLIES
+
+# Plies from the empty board covered by the book
+BOOK_PLIES = 4
+
+# Self-play games a move needs before it can be chosen
+MIN_GAMES = 4
+
+
+def opening_positions(plies):
+    """
+    List the canonical (layers, color index) positions reached before the given ply.
+    """
+    positions = []
+    frontier = {canonicalize((0,) * 6)[0]}
+    for ply in range(plies):
+        color_index = ply % 2
+        positions.extend((layers, color_index) for layers in sorted(frontier))
+        following = set()
+        for layers in frontier:
+            for move in generate_moves(layers, color_index):
+                child = play_move(layers, color_index, move)
+                if outcome(child) is None:
+                    following.add(canonicalize(child)[0])
+        frontier = following
+    return positions
+
+
+def book_from_table(table, plies=BOOK_PLIES):
+    """
+    Get a {key: packed move} book of the table's best move in each opening position.
+    """
+    moves = {}
+    for layers, color_index in opening_positions(plies):
+        move = best_move(layers, color_index, table.lookup)
+        if move is not None:
+            add_book_move(moves, layers, color_index, move)
+    return moves
+
+
+def self_play_game(task):
+    """
+    Play one game with random opening moves and a computer player for both colors.
+    Runs in worker processes, so it only takes and returns picklable values.
+    Returns red's score and the list of moves.
+    """
+    spec, random_plies, seed = task
+    rng = random.Random(seed)
+    players = [create_player(spec, RED, seed), create_player(spec, BLUE, seed + 1)]
+    layers = (0,) * 6
+    color_index = 0
+    moves = []
+    state = None
+    try:
+        while state is None and len(moves) < MAX_GAME_PLIES:
+            if len(moves) < random_plies:
+                legal = generate_moves(layers, color_index)
+                move = rng.choice(legal) if legal else None
+            else:
+                move = players[color_index].choose_move(layers)
+            if move is None:
+                break
+            layers = play_move(layers, color_index, move)
+            moves.append(move)
+            state = outcome(layers)
+            color_index = 1 - color_index
+    finally:
+        for player in players:
+            player.close()
+
+    red_score = {GameState.RED_WIN: 1.0, GameState.BLUE_WIN: 0.0}.get(state, 0.5)
+    return red_score, moves
+
+
+def format_game(red_score, moves):
+    """
+    Format a self-play game as one log line: red's score, then size:from:to moves.
+    Moves from the reserve have "-" as their from cell.
+    """
+    move_texts = [f"{size}:{'-' if from_cell is None else from_cell}:{to_cell}"
+                  for size, from_cell, to_cell in moves]
+    return " ".join([str(red_score)] + move_texts)
+
+
+def parse_game(line):
+    """
+    Parse a log line written by format_game.
+    """
+    score_text, *move_texts = line.split()
+    moves = []
+    for move_text in move_texts:
+        size, from_cell, to_cell = move_text.split(":")
+        moves.append((int(size), None if from_cell == "-" else int(from_cell), int(to_cell)))
+    return float(score_text), moves
+
+
+def book_from_games(games, plies=BOOK_PLIES, min_games=MIN_GAMES):
+    """
+    Get a {key: packed move} book from (red score, moves) games.
+    Each opening position gets the move with the best average result for the
+    color playing it, among moves played in at least min_games games.
+    """
+    # Games and total score of every (position key, canonical move)
+    totals = {}
+    for red_score, moves in games:
+        layers = (0,) * 6
+        for ply, move in enumerate(moves[:plies]):
+            color_index = ply % 2
+            key, transform = book_key(layers, color_index)
+            packed = pack_move(transform_move(move, transform))
+            count, score = totals.setdefault(key, {}).get(packed, (0, 0.0))
+            mover_score = red_score if color_index == 0 else 1.0 - red_score
+            totals[key][packed] = (count + 1, score + mover_score)
+            layers = play_move(layers, color_index, move)
+
+    moves = {}
+    for key, move_totals in totals.items():
+        ranked = [(score / count, count, packed)
+                  for packed, (count, score) in move_totals.items() if count >= min_games]
+        if ranked:
+            moves[key] = max(ranked)[2]
+    return moves
+
+
+def read_log(path):
+    """
+    Read the games of a self-play log; a missing log has no games.
+    """
+    try:
+        with open(path, encoding="utf-8") as log_file:
+            return [parse_game(line) for line in log_file if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def parse_args(argv):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Build a Gobblet Jr. opening book")
+    parser.add_argument("book", help="opening book file to write")
+    parser.add_argument("--table", help="solved-position table to take moves from")
+    parser.add_argument("--player", default="alphabeta:time=0.02",
+                        help="player spec for self-play after the random opening")
+    parser.add_argument("--games", type=int, default=1000,
+                        help="self-play games to play")
+    parser.add_argument("--plies", type=int, default=BOOK_PLIES,
+                        help="plies from the empty board covered by the book")
+    parser.add_argument("--min-games", type=int, default=MIN_GAMES,
+                        help="self-play games a move needs before it can be chosen")
+    parser.add_argument("--log", help="self-play log to add the games to and build from")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed for the random openings")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Main entry point function.
+    """
+    args = parse_args(argv)
+    if args.table:
+        with MappedResultTable(args.table) as table:
+            moves = book_from_table(table, args.plies)
+    else:
+        games = read_log(args.log) if args.log else []
+        # Seeds continue after the logged games, so repeated runs add new openings
+        tasks = [(args.player, args.plies, args.seed + 2 * (len(games) + game))
+                 for game in range(args.games)]
+        # Executor workers are not daemonic, so multi-worker MCTS players can run in them
+        with ProcessPoolExecutor(args.processes) as executor:
+            futures = [executor.submit(self_play_game, task) for task in tasks]
+            new_games = (future.result() for future in as_completed(futures))
+            if args.log:
+                with open(args.log, "a", encoding="utf-8") as log_file:
+                    for game in new_games:
+                        games.append(game)
+                        log_file.write(format_game(*game) + "\n")
+            else:
+                games.extend(new_games)
+        print(f"Self-play games: {len(games)}")
+        moves = book_from_games(games, args.plies, args.min_games)
+
+    write_book(moves, args.book)
+    print(f"Wrote {len(moves)} positions to {args.book}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,286 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-instance-attributes
+# pylint: disable=too-many-locals
+# pylint: disable=too-few-public-methods
+"""Monte Carlo Tree Search computer player for the Gobblet Jr. game."""
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from ..enums import GameState
+from ..bitboard import COLOR_INDEX, generate_moves, play_move, outcome
+from .turn import play_search_move
+
+# Playouts still running after this many plies are scored as draws
+MAX_PLAYOUT_PLIES = 100
+
+# Playouts between checks of the stop event
+STOP_CHECK_INTERVAL = 64
+
+
+class Node:
+    """
+    Search tree node for the position reached by a move.
+    Wins are counted for the color that made the move.
+    """
+    def __init__(self, layers, color_index, move=None, parent=None):
+        """
+        Initialize a node with no statistics.
+        """
+        self.layers = layers
+        self.color_index = color_index  # Color to move in this node
+        self.move = move
+        self.parent = parent
+        self.state = outcome(layers) if parent else None
+        self.children = []
+        self.untried_moves = generate_moves(layers, color_index) if self.state is None else []
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration):
+        """
+        Pick the child with the highest UCT score.
+        """
+        log_visits = math.log(self.visits)
+        return max(self.children,
+                   key=lambda child: (child.wins / child.visits +
+                                      exploration * math.sqrt(log_visits / child.visits)))
+
+    def expand(self, rng):
+        """
+        Add a child for one untried move.
+        """
+        move = self.untried_moves.pop(rng.randrange(len(self.untried_moves)))
+        child = Node(play_move(self.layers, self.color_index, move),
+                     1 - self.color_index, move, self)
+        self.children.append(child)
+        return child
+
+
+def winner_index(state):
+    """
+    Get the color index of the winner of a finished game, or None for a draw.
+    """
+    if state == GameState.RED_WIN:
+        return 0
+    if state == GameState.BLUE_WIN:
+        return 1
+    return None
+
+
+def random_playout(layers, color_index, rng):
+    """
+    Play random moves until the game ends and return the winner's color index.
+    """
+    for _ in range(MAX_PLAYOUT_PLIES):
+        moves = generate_moves(layers, color_index)
+        if not moves:
+            return None
+        layers = play_move(layers, color_index, moves[rng.randrange(len(moves))])
+        state = outcome(layers)
+        if state is not None:
+            return winner_index(state)
+        color_index = 1 - color_index
+    return None
+
+
+def grow_tree(root, playouts, time_budget, exploration, rng, stop_event=None):
+    """
+    Run playouts from the root until the playout count or time budget is used up.
+    The search ends early once stop_event is set.
+    Returns the number of playouts completed and the time taken.
+    """
+    start = time.perf_counter()
+    deadline = start + time_budget
+    completed = 0
+
+    while completed < playouts and time.perf_counter() < deadline:
+        if (stop_event is not None and completed % STOP_CHECK_INTERVAL == 0 and
+                stop_event.is_set()):
+            break
+
+        # Selection
+        node = root
+        while not node.untried_moves and node.children:
+            node = node.select_child(exploration)
+
+        # Expansion
+        if node.untried_moves:
+            node = node.expand(rng)
+
+        # Simulation
+        if node.state is not None:
+            winner = winner_index(node.state)
+        else:
+            winner = random_playout(node.layers, node.color_index, rng)
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif node.parent and winner == node.parent.color_index:
+                node.wins += 1
+            node = node.parent
+        completed += 1
+
+    return completed, time.perf_counter() - start
+
+
+def search_tree(layers, color_index, playouts, time_budget, exploration, seed):
+    """
+    Grow one search tree and return its root visit counts.
+    Runs in worker processes, so it only takes and returns picklable values.
+    """
+    root = Node(tuple(layers), color_index)
+    completed, elapsed = grow_tree(root, playouts, time_budget, exploration,
+                                   random.Random(seed))
+    visits = [(child.move, child.visits, child.wins) for child in root.children]
+    return visits, completed, elapsed
+
+
+class MCTSStats:
+    """
+    Statistics of the most recent search, for sizing worker fleets.
+    """
+    def __init__(self):
+        """
+        Initialize empty statistics.
+        """
+        self.playouts = 0
+        self.elapsed = 0.0
+        self.worker_rates = []  # Playouts per second of each tree
+
+    def playouts_per_second(self):
+        """
+        Get the combined playout rate of all trees.
+        """
+        return sum(self.worker_rates)
+
+
+class MCTSPlayer:
+    """
+    Computer player using Monte Carlo Tree Search.
+    With several workers, independent trees grow in a process pool and their
+    root visit counts are merged before choosing a move. With one worker, the
+    tree is kept between moves, so playouts from pondering are reused.
+    Positions in the optional opening book are answered without searching.
+    """
+    def __init__(self, color, time_budget, playouts=100000, workers=1,
+                 exploration=math.sqrt(2), seed=None, book=None):
+        """
+        Initialize the computer player.
+        """
+        self.color = color
+        self.book = book
+        self.time_budget = time_budget
+        self.playouts = playouts
+        self.workers = workers
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.stats = MCTSStats()
+        self.stop_event = None  # Event that ends the search early when set
+        self._executor = None
+        self._tree = None  # Kept tree, rooted where the opponent is to move
+
+    def take_turn(self, game):
+        """
+        Search the game's position and play the chosen move through the turn flow.
+        """
+        if game.get_current_player().color != self.color:
+            return False
+        move = self.choose_move(tuple(game.board.layers))
+        if move is None:
+            return False
+        return play_search_move(game, move)
+
+    def choose_move(self, layers):
+        """
+        Get the most visited move for this player's color.
+        """
+        color_index = COLOR_INDEX[self.color]
+        if self.book is not None:
+            move = self.book.move(layers, color_index)
+            if move is not None:
+                return move
+        if not generate_moves(layers, color_index):
+            return None
+
+        start = time.perf_counter()
+        if self.workers == 1:
+            # Playouts already in a reused tree count towards the total, but
+            # every root move still gets expanded
+            root = self._reuse_tree(layers, color_index)
+            playouts = max(self.playouts - root.visits, len(root.untried_moves))
+            completed, elapsed = grow_tree(root, playouts, self.time_budget,
+                                           self.exploration, self.rng, self.stop_event)
+            results = [([(child.move, child.visits, child.wins) for child in root.children],
+                        completed, elapsed)]
+        else:
+            # Each tree gets its share of the playouts and the full time budget
+            share = max(1, self.playouts // self.workers)
+            seeds = [self.rng.getrandbits(64) for _ in range(self.workers)]
+            args = [(layers, color_index, share, self.time_budget, self.exploration, seed)
+                    for seed in seeds]
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            results = list(self._executor.map(search_tree, *zip(*args)))
+
+        # Merge root statistics from every tree
+        visits = {}
+        self.stats = MCTSStats()
+        for tree_visits, completed, elapsed in results:
+            for move, move_visits, _ in tree_visits:
+                visits[move] = visits.get(move, 0) + move_visits
+            self.stats.playouts += completed
+            self.stats.worker_rates.append(completed / elapsed if elapsed > 0 else 0.0)
+        self.stats.elapsed = time.perf_counter() - start
+
+        if not visits:
+            return generate_moves(layers, color_index)[0]
+        move = max(visits, key=visits.get)
+        if self.workers == 1:
+            self._tree = next(child for child in root.children if child.move == move)
+        return move
+
+    def ponder(self, layers, time_limit):
+        """
+        Grow the kept tree for a position where the opponent is to move, so the
+        subtree for the opponent's actual reply is ready on this player's turn.
+        Runs until time_limit, the playout count or the stop event; only
+        single-worker players keep a tree to ponder into.
+        """
+        if self.workers != 1:
+            return
+        root = self._reuse_tree(layers, 1 - COLOR_INDEX[self.color])
+        self._tree = root
+        grow_tree(root, self.playouts - root.visits, time_limit, self.exploration, self.rng,
+                  self.stop_event)
+
+    def _reuse_tree(self, layers, color_index):
+        """
+        Get the kept tree's node for a position, or a new root when it has none.
+        """
+        tree = self._tree
+        self._tree = None
+        if tree is not None:
+            # Detach the node so playouts stop at it and the rest of the old tree can be freed
+            if tree.layers == layers and tree.color_index == color_index:
+                tree.parent = None
+                return tree
+            for child in tree.children:
+                if child.layers == layers and child.color_index == color_index:
+                    child.parent = None
+                    return child
+        return Node(tuple(layers), color_index)
+
+    def close(self):
+        """
+        Shut down the worker processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
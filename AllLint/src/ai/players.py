@@ -0,0 +1,116 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""Pluggable computer players for the Gobblet Jr. game."""
+import random
+from ..bitboard import COLOR_INDEX, generate_moves
+from .alpha_beta import AlphaBetaPlayer
+from .book import OpeningBook
+from .mcts import MCTSPlayer
+from .solver import MappedResultTable
+from .turn import play_search_move
+
+
+class RandomPlayer:
+    """
+    Computer player choosing uniformly among the legal moves.
+    """
+    def __init__(self, color, seed=None):
+        """
+        Initialize the random player.
+        """
+        self.color = color
+        self.rng = random.Random(seed)
+
+    def take_turn(self, game):
+        """
+        Play a random legal move through the turn flow.
+        """
+        if game.get_current_player().color != self.color:
+            return False
+        moves = game.legal_moves()
+        if not moves:
+            return False
+        piece, row, col = self.rng.choice(moves)
+        game.select_piece(piece)
+        return game.make_move(row, col)
+
+    def choose_move(self, layers):
+        """
+        Get a random legal (size, from_cell, to_cell) move, or None when there is none.
+        """
+        moves = generate_moves(layers, COLOR_INDEX[self.color])
+        return self.rng.choice(moves) if moves else None
+
+    def close(self):
+        """
+        Release player resources.
+        """
+
+
+class TablePlayer:
+    """
+    Computer player reading its moves from a solved-position table.
+    """
+    def __init__(self, color, path):
+        """
+        Initialize the player with a mapped result table.
+        """
+        self.color = color
+        self.table = MappedResultTable(path)
+
+    def take_turn(self, game):
+        """
+        Play the table's best move through the turn flow.
+        """
+        if game.get_current_player().color != self.color:
+            return False
+        move = self.table.game_best_move(game)
+        if move is None:
+            return False
+        return play_search_move(game, move)
+
+    def choose_move(self, layers):
+        """
+        Get the table's best move for this player's color in a position.
+        """
+        return self.table.best_move(layers, COLOR_INDEX[self.color])
+
+    def close(self):
+        """
+        Unmap the result table.
+        """
+        self.table.close()
+
+
+def parse_player_spec(spec):
+    """
+    Split a player spec like "mcts:time=0.5,playouts=2000" into a kind and options.
+    """
+    kind, _, option_text = spec.partition(":")
+    options = {}
+    for option in filter(None, option_text.split(",")):
+        key, _, value = option.partition("=")
+        options[key.strip()] = value.strip()
+    return kind.strip(), options
+
+
+def create_player(spec, color, seed=None):
+    """
+    Create a computer player for a color from a player spec.
+    Kinds: random, alphabeta (time, depth, book), mcts (time, playouts, workers, book)
+    and table (path).
+    """
+    kind, options = parse_player_spec(spec)
+    book = OpeningBook(options["book"]) if "book" in options else None
+    if kind == "random":
+        return RandomPlayer(color, seed)
+    if kind == "alphabeta":
+        return AlphaBetaPlayer(color, float(options.get("time", 0.1)),
+                               max_depth=int(options.get("depth", 64)), book=book)
+    if kind == "mcts":
+        return MCTSPlayer(color, float(options.get("time", 0.1)),
+                          playouts=int(options.get("playouts", 100000)),
+                          workers=int(options.get("workers", 1)), seed=seed, book=book)
+    if kind == "table":
+        return TablePlayer(color, options["path"])
+    raise ValueError(f"Unknown player kind: {kind}")
@@ -0,0 +1,49 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""Position numbering for solved-position tables of the Gobblet Jr. game."""
+from ..constants import RESERVE_COUNT
+from ..bitboard import NUM_SIZES, NUM_CELLS, FULL_MASK
+
+
+def _layer_pairs():
+    """
+    List every (red mask, blue mask) pair one piece size can form on the board.
+    """
+    masks = [mask for mask in range(FULL_MASK + 1) if mask.bit_count() <= RESERVE_COUNT]
+    return [(red, blue) for red in masks for blue in masks if not red & blue]
+
+
+# Rank of each (red mask, blue mask) pair, indexed by (red << 9) | blue
+LAYER_PAIRS = _layer_pairs()
+LAYER_RANK = [-1] * (1 << (2 * NUM_CELLS))
+for _rank, (_red, _blue) in enumerate(LAYER_PAIRS):
+    LAYER_RANK[(_red << NUM_CELLS) | _blue] = _rank
+NUM_LAYER_PAIRS = len(LAYER_PAIRS)
+
+# Number of position indices, including the side to move
+NUM_POSITIONS = NUM_LAYER_PAIRS ** NUM_SIZES * 2
+
+
+def position_index(layers, color_index):
+    """
+    Get the position number of the layers with the given color to move.
+    Reserves are implied by the pieces on the board, so they need no digits.
+    """
+    index = 0
+    for size in range(NUM_SIZES - 1, -1, -1):
+        index = index * NUM_LAYER_PAIRS + LAYER_RANK[
+            (layers[size] << NUM_CELLS) | layers[NUM_SIZES + size]]
+    return index * 2 + color_index
+
+
+def index_position(index):
+    """
+    Get the layers and the color to move for a position number.
+    """
+    color_index = index & 1
+    index >>= 1
+    layers = [0] * (2 * NUM_SIZES)
+    for size in range(NUM_SIZES):
+        index, rank = divmod(index, NUM_LAYER_PAIRS)
+        layers[size], layers[NUM_SIZES + size] = LAYER_PAIRS[rank]
+    return tuple(layers), color_index
@@ -0,0 +1,468 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-locals
+"""
+Retrograde solver for the Gobblet Jr. game.
+
+Enumerates every position reachable from the empty board under the rules in
+GobbletRules, labels each one win/loss/draw for the side to move with its
+distance to the end of the game, and writes the labels to a binary table.
+Positions are reduced by the eight board symmetries, so only canonical
+positions are solved and stored. The table holds one entry per reachable
+canonical position, ranked by position number; the sorted position numbers
+are stored alongside, split into buckets by their high bits, so a lookup is
+a bisect within one bucket.
+
+To solve the game:
+    python3 -m src.ai.solver gobblet_solved.bin
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from ..enums import GameState
+from ..bitboard import (COLOR_INDEX, NUM_SIZES, NUM_CELLS, FULL_MASK, layer_index, cover_mask,
+                        visible_mask, top_size, generate_moves, play_move, outcome)
+from ..symmetry import canonicalize
+from .position_index import NUM_POSITIONS, position_index, index_position
+
+# Result values for the side to move, stored in the low two bits of each entry
+UNKNOWN = 0
+WIN = 1
+LOSS = 2
+DRAW = 3
+
+# Distance to the end of the game is stored in the upper six bits
+MAX_DISTANCE = 63
+
+# Table file header: magic, format version, number of entries. The header is
+# followed by the bucket offsets (uint64), the low bits of each entry's position
+# number (uint16) and the entries (one byte each), all little-endian.
+TABLE_MAGIC = b"GJRT"
+TABLE_VERSION = 3
+TABLE_HEADER = struct.Struct("<4sIQ")
+
+# Position numbers are bucketed by their bits above the low BUCKET_BITS
+BUCKET_BITS = 16
+BUCKET_MASK = (1 << BUCKET_BITS) - 1
+NUM_BUCKETS = (NUM_POSITIONS >> BUCKET_BITS) + 1
+
+
+def encode_result(value, distance):
+    """
+    Pack a result value and distance into one table entry.
+    """
+    if distance > MAX_DISTANCE:
+        raise ValueError(f"Distance {distance} does not fit in a table entry")
+    return (distance << 2) | value
+
+
+def decode_result(entry):
+    """
+    Unpack a table entry into its result value and distance.
+    """
+    return entry & 3, entry >> 2
+
+
+def table_index(layers, color_index):
+    """
+    Get the position number of the canonical form of a position.
+    """
+    return position_index(canonicalize(layers)[0], color_index)
+
+
+def predecessors(layers, color_index):
+    """
+    Get the layers of every non-terminal position whose move led to these layers.
+    The last move was made by the color not to move now.
+    """
+    mover = 1 - color_index
+    result = []
+    own_visible = visible_mask(layers, mover)
+    for to_cell in range(NUM_CELLS):
+        to_bit = 1 << to_cell
+        if not own_visible & to_bit:
+            continue
+        size = top_size(layers, to_bit)
+        index = layer_index(mover, size)
+        lifted = list(layers)
+        lifted[index] &= ~to_bit
+
+        # The piece came from the reserve
+        candidates = [tuple(lifted)]
+
+        # The piece came from another square where it was on top
+        sources = FULL_MASK & ~cover_mask(lifted, size) & ~to_bit
+        for from_cell in range(NUM_CELLS):
+            if sources >> from_cell & 1:
+                moved = list(lifted)
+                moved[index] |= 1 << from_cell
+                candidates.append(tuple(moved))
+
+        for candidate in candidates:
+            if outcome(candidate) is None:
+                result.append(candidate)
+    return result
+
+
+def _bit_set(bitset, index):
+    """
+    Check if a bit is set in a bitset.
+    """
+    return bitset[index >> 3] >> (index & 7) & 1
+
+
+def _set_bit(bitset, index):
+    """
+    Set a bit in a bitset.
+    """
+    bitset[index >> 3] |= 1 << (index & 7)
+
+
+def _iter_bits(bitset, start, stop, clear=False):
+    """
+    Yield the indices in [start, stop) of the set bits of a bitset, or of the
+    clear bits. start must be a multiple of 64.
+    """
+    words = array("Q", bitset[start >> 3:(stop + 63) >> 6 << 3].ljust((stop - start + 63) >> 6 << 3,
+                                                                      b"\0"))
+    if sys.byteorder == "big":
+        words.byteswap()
+    for word_number, word in enumerate(words):
+        if clear:
+            word ^= (1 << 64) - 1
+        base = start + word_number * 64
+        while word:
+            low_bit = word & -word
+            index = base + low_bit.bit_length() - 1
+            if index >= stop:
+                return
+            yield index
+            word ^= low_bit
+
+
+def position_rank(offsets, lows, index):
+    """
+    Get the rank of a position number among a table's positions, or None when
+    the table does not hold it.
+    """
+    bucket = index >> BUCKET_BITS
+    start, end = offsets[bucket], offsets[bucket + 1]
+    low = index & BUCKET_MASK
+    rank = bisect_left(lows, low, start, end)
+    if rank < end and lows[rank] == low:
+        return rank
+    return None
+
+
+class Solver:
+    """
+    Retrograde solver over the reachable canonical positions.
+    Enumeration marks positions in a bitset over all position numbers; the set
+    positions are then ranked, and every later array is indexed by rank. Until
+    a position is resolved, its entry counts its distinct canonical children
+    that are not yet known to win.
+    """
+    def __init__(self):
+        """
+        Initialize empty solver storage.
+        """
+        self.reachable = None
+        self.reachable_count = 0
+        self.terminals = array("Q")
+        self.offsets = None
+        self.lows = None
+        self.results = None
+        self.resolved = None
+
+    def rank(self, index):
+        """
+        Get the rank of a position number, or None when it is not reachable.
+        """
+        return position_rank(self.offsets, self.lows, index)
+
+    def enumerate_positions(self):
+        """
+        Mark every canonical position reachable from the empty board, then rank
+        them and count the children of each.
+        """
+        self.reachable = bytearray(NUM_POSITIONS // 8 + 1)
+        start = table_index((0,) * (2 * NUM_SIZES), 0)
+        _set_bit(self.reachable, start)
+        self.reachable_count = 1
+        stack = array("Q", [start])
+        while stack:
+            index = stack.pop()
+            layers, color_index = index_position(index)
+            if outcome(layers) is not None:
+                self.terminals.append(index)
+                continue
+            for move in generate_moves(layers, color_index):
+                child = table_index(play_move(layers, color_index, move), 1 - color_index)
+                if not _bit_set(self.reachable, child):
+                    _set_bit(self.reachable, child)
+                    self.reachable_count += 1
+                    stack.append(child)
+
+        # Rank the reachable positions bucket by bucket; the bitset is then dropped
+        self.offsets = array("Q", [0])
+        self.lows = array("H")
+        bucket_size = 1 << BUCKET_BITS
+        for bucket in range(NUM_BUCKETS):
+            first = bucket * bucket_size
+            self.lows.extend(index - first for index in
+                             _iter_bits(self.reachable, first,
+                                        min(first + bucket_size, NUM_POSITIONS)))
+            self.offsets.append(len(self.lows))
+        self.reachable = None
+
+        # Symmetric moves lead to the same canonical child and count once
+        self.results = bytearray(self.reachable_count)
+        self.resolved = bytearray(self.reachable_count // 8 + 1)
+        for bucket in range(NUM_BUCKETS):
+            for rank in range(self.offsets[bucket], self.offsets[bucket + 1]):
+                layers, color_index = index_position((bucket << BUCKET_BITS) | self.lows[rank])
+                if outcome(layers) is None:
+                    self.results[rank] = len({
+                        table_index(play_move(layers, color_index, move), 1 - color_index)
+                        for move in generate_moves(layers, color_index)})
+        return self.reachable_count
+
+    def _resolve(self, rank, value, distance):
+        """
+        Record the final result of a position.
+        """
+        self.results[rank] = encode_result(value, distance)
+        _set_bit(self.resolved, rank)
+
+    def solve(self):
+        """
+        Label every reachable position, working backwards from finished games.
+        """
+        if not self.reachable_count:
+            self.enumerate_positions()
+
+        # Finished games are decided before anyone moves
+        frontier = array("Q")
+        for index in self.terminals:
+            layers, color_index = index_position(index)
+            state = outcome(layers)
+            if state == GameState.DRAW:
+                self._resolve(self.rank(index), DRAW, 0)
+                continue
+            winner = 0 if state == GameState.RED_WIN else 1
+            self._resolve(self.rank(index), WIN if winner == color_index else LOSS, 0)
+            frontier.append(index)
+
+        # A move into a lost position wins; a position whose moves all lead to
+        # won positions is lost. Each pass settles positions one move further out.
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = array("Q")
+            for index in frontier:
+                layers, color_index = index_position(index)
+                value = self.results[self.rank(index)] & 3
+                previous_indices = {table_index(previous_layers, 1 - color_index)
+                                    for previous_layers in predecessors(layers, color_index)}
+                for previous in previous_indices:
+                    rank = self.rank(previous)
+                    if rank is None or _bit_set(self.resolved, rank):
+                        continue
+                    if value == LOSS:
+                        self._resolve(rank, WIN, distance)
+                        next_frontier.append(previous)
+                    else:
+                        self.results[rank] -= 1
+                        if not self.results[rank]:
+                            self._resolve(rank, LOSS, distance)
+                            next_frontier.append(previous)
+            frontier = next_frontier
+
+        # Whatever could not be forced either way is a draw
+        for rank in list(_iter_bits(self.resolved, 0, self.reachable_count, clear=True)):
+            self._resolve(rank, DRAW, 0)
+
+    def write(self, path):
+        """
+        Write the result table to a file.
+        """
+        offsets = array("Q", self.offsets)
+        lows = array("H", self.lows)
+        if sys.byteorder == "big":
+            offsets.byteswap()
+            lows.byteswap()
+        with open(path, "wb") as table_file:
+            table_file.write(TABLE_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, self.reachable_count))
+            table_file.write(offsets.tobytes())
+            table_file.write(lows.tobytes())
+            table_file.write(self.results)
+
+
+def best_move(layers, color_index, lookup):
+    """
+    Pick the move with the best table result for the color to move.
+    Prefers the fastest win, then a draw, then the slowest loss.
+    """
+    best = None
+    best_rank = None
+    for move in generate_moves(layers, color_index):
+        child = play_move(layers, color_index, move)
+        state = outcome(child)
+        if state == GameState.DRAW:
+            value, distance = DRAW, 0
+        elif state is not None:
+            winner = 0 if state == GameState.RED_WIN else 1
+            value, distance = (WIN if winner == color_index else LOSS), 0
+        else:
+            # The table stores results for the opponent, who moves next
+            value, distance = decode_result(lookup(table_index(child, 1 - color_index)))
+            value = {WIN: LOSS, LOSS: WIN}.get(value, value)
+
+        if value == WIN:
+            rank = (2, -distance)
+        elif value == LOSS:
+            rank = (0, distance)
+        else:
+            rank = (1, 0)
+        if best_rank is None or rank > best_rank:
+            best, best_rank = move, rank
+    return best
+
+
+def read_table_header(table_file, path):
+    """
+    Read and check the header of a result table file; returns its number of entries.
+    """
+    magic, version, entries = TABLE_HEADER.unpack(table_file.read(TABLE_HEADER.size))
+    if magic != TABLE_MAGIC or version != TABLE_VERSION:
+        raise ValueError(f"{path} is not a Gobblet Jr. result table")
+    return entries
+
+
+def table_sections(data, entries, path):
+    """
+    Split the data after a table header into its bucket offsets, low bits and entries.
+    """
+    if sys.byteorder == "big":
+        raise ValueError("Result tables can only be read on little-endian machines")
+    offsets_size = 8 * (NUM_BUCKETS + 1)
+    if len(data) != offsets_size + 3 * entries:
+        raise ValueError(f"{path} is truncated or has the wrong size")
+    offsets = data[:offsets_size].cast("Q")
+    lows = data[offsets_size:offsets_size + 2 * entries].cast("H")
+    return offsets, lows, data[offsets_size + 2 * entries:]
+
+
+class ResultTable:
+    """
+    Solved-position table loaded into memory.
+    """
+    def __init__(self, path):
+        """
+        Load a result table file.
+        """
+        with open(path, "rb") as table_file:
+            entries = read_table_header(table_file, path)
+            data = memoryview(table_file.read())
+        self.offsets, self.lows, self.results = table_sections(data, entries, path)
+
+    def __len__(self):
+        """
+        Get the number of positions in the table.
+        """
+        return len(self.results)
+
+    def lookup(self, index):
+        """
+        Get the packed result entry of a position number; positions not in the
+        table, which cannot be reached, are UNKNOWN.
+        """
+        rank = position_rank(self.offsets, self.lows, index)
+        return UNKNOWN if rank is None else self.results[rank]
+
+    def result(self, layers, color_index):
+        """
+        Get the (value, distance) result for the color to move.
+        """
+        return decode_result(self.lookup(table_index(layers, color_index)))
+
+    def best_move(self, layers, color_index):
+        """
+        Get the best move for the color to move.
+        """
+        return best_move(layers, color_index, self.lookup)
+
+    def game_result(self, game):
+        """
+        Get the (value, distance) result for the player to move in a game.
+        """
+        return self.result(game.board.layers, COLOR_INDEX[game.get_current_player().color])
+
+    def game_best_move(self, game):
+        """
+        Get the best move for the player to move in a game.
+        """
+        return self.best_move(tuple(game.board.layers),
+                              COLOR_INDEX[game.get_current_player().color])
+
+
+class MappedResultTable(ResultTable):
+    """
+    Solved-position table read in place through a read-only memory map.
+    Processes mapping the same file share one page-cache copy, and opening
+    the table costs the same whatever its size.
+    """
+    def __init__(self, path):  # pylint: disable=super-init-not-called
+        """
+        Map a result table file.
+        """
+        with open(path, "rb") as table_file:
+            entries = read_table_header(table_file, path)
+            self._map = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = memoryview(self._map)[TABLE_HEADER.size:]
+        self.offsets, self.lows, self.results = table_sections(self._data, entries, path)
+
+    def close(self):
+        """
+        Unmap the table file.
+        """
+        # Every view into the map must be released before it can close
+        for view in (self.offsets, self.lows, self.results, self._data):
+            view.release()
+        self._map.close()
+
+    def __enter__(self):
+        """
+        Use the table as a context manager.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Unmap the table when leaving the context.
+        """
+        self.close()
+
+
+def main(argv=None):
+    """
+    Main entry point function.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("usage: python3 -m src.ai.solver TABLE_PATH")
+        return 2
+
+    solver = Solver()
+    print(f"Reachable positions: {solver.enumerate_positions()}")
+    solver.solve()
+    solver.write(argv[0])
+    print(f"Wrote {argv[0]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
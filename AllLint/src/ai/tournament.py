@@ -0,0 +1,198 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-locals
+"""Headless tournaments between computer players for the Gobblet Jr. game."""
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ..constants import RED, BLUE
+from ..enums import GameState
+from ..rules import GobbletRules
+from .players import create_player
+
+# Games still running after this many plies are scored as draws
+MAX_GAME_PLIES = 200
+
+# Two-sided 95% normal quantile for the Elo confidence intervals
+CONFIDENCE_Z = 1.96
+
+# Elo points per natural-log unit of the logistic rating model
+ELO_SCALE = 400 / math.log(10)
+
+
+def play_game(task):
+    """
+    Play one game between two player specs and return its result.
+    Runs in worker processes, so it only takes and returns picklable values.
+    """
+    game_id, red_spec, blue_spec, seed, max_plies = task
+    game = GobbletRules()
+    players = {RED: create_player(red_spec, RED, seed),
+               BLUE: create_player(blue_spec, BLUE, seed + 1)}
+    plies = 0
+    try:
+        while (game.current_state in (GameState.PLAYER_RED, GameState.PLAYER_BLUE) and
+               plies < max_plies):
+            # A player who cannot move leaves the game without a result
+            if not players[game.get_current_player().color].take_turn(game):
+                break
+            plies += 1
+    finally:
+        for player in players.values():
+            player.close()
+
+    if game.current_state == GameState.RED_WIN:
+        red_score = 1.0
+    elif game.current_state == GameState.BLUE_WIN:
+        red_score = 0.0
+    else:
+        red_score = 0.5
+    return game_id, red_spec, blue_spec, red_score, plies
+
+
+def round_robin_tasks(specs, games_per_pair, max_plies=MAX_GAME_PLIES, seed=0):
+    """
+    Build game tasks for every pair of players, alternating colors.
+    """
+    tasks = []
+    for position, first in enumerate(specs):
+        for second in specs[position + 1:]:
+            for game in range(games_per_pair):
+                red, blue = (first, second) if game % 2 == 0 else (second, first)
+                game_id = len(tasks)
+                tasks.append((game_id, red, blue, seed + 2 * game_id, max_plies))
+    return tasks
+
+
+def swiss_pairings(specs, scores, played):
+    """
+    Pair players with similar scores, avoiding rematches where possible.
+    """
+    waiting = sorted(specs, key=lambda spec: -scores[spec])
+    pairs = []
+    while len(waiting) > 1:
+        first = waiting.pop(0)
+        opponent = next((spec for spec in waiting if (first, spec) not in played), waiting[0])
+        waiting.remove(opponent)
+        pairs.append((first, opponent))
+    return pairs
+
+
+def fit_elo(results, specs, iterations=200):
+    """
+    Fit Elo ratings to game results by maximum likelihood.
+    Returns {spec: (rating, confidence half-width)}; ratings average to zero.
+    Draws count as half a win for each side.
+    """
+    ratings = {spec: 0.0 for spec in specs}
+    for _ in range(iterations):
+        # One minorization-maximization step of the Bradley-Terry model
+        strengths = {spec: math.exp(ratings[spec] / ELO_SCALE) for spec in specs}
+        updated = {}
+        for spec in specs:
+            games = 0
+            score = 0.0
+            weight = 0.0
+            for _, red, blue, red_score, _ in results:
+                if spec not in (red, blue):
+                    continue
+                other = blue if spec == red else red
+                games += 1
+                score += red_score if spec == red else 1.0 - red_score
+                weight += 1.0 / (strengths[spec] + strengths[other])
+            # Keep players with no wins or no losses at a finite rating
+            score = min(max(score, 0.5), games - 0.5)
+            updated[spec] = ELO_SCALE * math.log(score / weight) if weight else 0.0
+        mean = sum(updated.values()) / len(updated)
+        ratings = {spec: rating - mean for spec, rating in updated.items()}
+
+    # Standard errors from the diagonal of the Fisher information
+    intervals = {}
+    for spec in specs:
+        information = 0.0
+        for _, red, blue, _, _ in results:
+            if spec not in (red, blue):
+                continue
+            other = blue if spec == red else red
+            expected = 1.0 / (1.0 + math.exp((ratings[other] - ratings[spec]) / ELO_SCALE))
+            information += expected * (1.0 - expected)
+        error = ELO_SCALE / math.sqrt(information) if information else float("inf")
+        intervals[spec] = (ratings[spec], CONFIDENCE_Z * error)
+    return intervals
+
+
+class Tournament:
+    """
+    Runs games between player specs over a process pool and collects results.
+    The pool's workers are not daemonic, so multi-worker MCTS players can start
+    their own worker processes inside them.
+    """
+    def __init__(self, specs, processes=None, max_plies=MAX_GAME_PLIES, seed=0):
+        """
+        Initialize a tournament.
+        """
+        self.specs = list(specs)
+        self.processes = processes
+        self.max_plies = max_plies
+        self.seed = seed
+        self.results = []
+
+    def _run_tasks(self, executor, tasks, on_result):
+        """
+        Play tasks in the executor, reporting each result as soon as it finishes.
+        """
+        futures = [executor.submit(play_game, task) for task in tasks]
+        for future in as_completed(futures):
+            result = future.result()
+            self.results.append(result)
+            if on_result:
+                on_result(result)
+
+    def run_round_robin(self, games_per_pair, on_result=None):
+        """
+        Play every pair of players games_per_pair times.
+        """
+        tasks = round_robin_tasks(self.specs, games_per_pair, self.max_plies, self.seed)
+        with ProcessPoolExecutor(self.processes) as executor:
+            self._run_tasks(executor, tasks, on_result)
+        return self.results
+
+    def run_swiss(self, rounds, on_result=None):
+        """
+        Play Swiss rounds; each pairing plays one game with each color.
+        """
+        scores = {spec: 0.0 for spec in self.specs}
+        played = set()
+        with ProcessPoolExecutor(self.processes) as executor:
+            for _ in range(rounds):
+                tasks = []
+                for first, second in swiss_pairings(self.specs, scores, played):
+                    played.update(((first, second), (second, first)))
+                    for red, blue in ((first, second), (second, first)):
+                        game_id = len(self.results) + len(tasks)
+                        tasks.append((game_id, red, blue, self.seed + 2 * game_id,
+                                      self.max_plies))
+                start = len(self.results)
+                self._run_tasks(executor, tasks, on_result)
+                for _, red, blue, red_score, _ in self.results[start:]:
+                    scores[red] += red_score
+                    scores[blue] += 1.0 - red_score
+        return self.results
+
+    def standings(self):
+        """
+        Get (spec, games, score, rating, interval) rows, best rating first.
+        """
+        ratings = fit_elo(self.results, self.specs)
+        rows = []
+        for spec in self.specs:
+            games = 0
+            score = 0.0
+            for _, red, blue, red_score, _ in self.results:
+                if spec == red:
+                    games += 1
+                    score += red_score
+                elif spec == blue:
+                    games += 1
+                    score += 1.0 - red_score
+            rows.append((spec, games, score) + ratings[spec])
+        return sorted(rows, key=lambda row: -row[3])
@@ -0,0 +1,17 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""Helpers for computer players taking turns in a Gobblet Jr. game."""
+from ..constants import BOARD_SIZE
+
+
+def play_search_move(game, move):
+    """
+    Play a (size, from_cell, to_cell) search move through select_piece and make_move.
+    """
+    size, from_cell, to_cell = move
+    if from_cell is None:
+        piece = game.get_current_player().get_piece_of_size(size)
+    else:
+        piece = game.board.get_top_piece(from_cell // BOARD_SIZE, from_cell % BOARD_SIZE)
+    game.select_piece(piece)
+    return game.make_move(to_cell // BOARD_SIZE, to_cell % BOARD_SIZE)
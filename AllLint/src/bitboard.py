@@ -0,0 +1,202 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""Bitboard representation of the Gobblet Jr. board."""
+from .constants import BOARD_SIZE, RED, BLUE, RESERVE_COUNT
+from .enums import GameState
+from .board import Board, LINES
+
+NUM_SIZES = 3
+NUM_CELLS = BOARD_SIZE * BOARD_SIZE
+FULL_MASK = (1 << NUM_CELLS) - 1
+
+# Index of each player color in the layer list
+COLOR_INDEX = {RED: 0, BLUE: 1}
+PLAYER_COLORS = (RED, BLUE)
+
+# Masks for the eight winning lines (rows, columns, diagonals)
+LINE_MASKS = tuple(sum(1 << (row * BOARD_SIZE + col) for row, col in line) for line in LINES)
+
+
+def cell_bit(row, col):
+    """
+    Get the bit for the specified board position.
+    """
+    return 1 << (row * BOARD_SIZE + col)
+
+
+def layer_index(color_index, size):
+    """
+    Get the position of a (color, size) layer in a layer list.
+    """
+    return color_index * NUM_SIZES + size
+
+
+def occupied_mask(layers):
+    """
+    Get the mask of all squares holding at least one piece.
+    """
+    return layers[0] | layers[1] | layers[2] | layers[3] | layers[4] | layers[5]
+
+
+def cover_mask(layers, size):
+    """
+    Get the mask of squares a piece of the given size cannot be placed on.
+    """
+    mask = 0
+    for larger in range(size, NUM_SIZES):
+        mask |= layers[larger] | layers[NUM_SIZES + larger]
+    return mask
+
+
+def visible_mask(layers, color_index):
+    """
+    Get the mask of squares whose top piece belongs to the given color.
+    """
+    large = layers[2] | layers[5]
+    medium = layers[1] | layers[4]
+    base = color_index * NUM_SIZES
+    return (layers[base + 2] |
+            (layers[base + 1] & ~large) |
+            (layers[base] & ~large & ~medium))
+
+
+def has_line(mask):
+    """
+    Check if the mask contains a complete row, column or diagonal.
+    """
+    for line in LINE_MASKS:
+        if mask & line == line:
+            return True
+    return False
+
+
+def top_size(layers, bit):
+    """
+    Get the size of the top piece on a square, or None if it is empty.
+    """
+    for size in range(NUM_SIZES - 1, -1, -1):
+        if (layers[size] | layers[NUM_SIZES + size]) & bit:
+            return size
+    return None
+
+
+def reserve_count(layers, color_index, size):
+    """
+    Get how many pieces of a size a color still holds in reserve.
+    """
+    return RESERVE_COUNT - layers[layer_index(color_index, size)].bit_count()
+
+
+def generate_moves(layers, color_index):
+    """
+    Generate all moves as (size, from_cell, to_cell), with from_cell None for reserve.
+    Follows GobbletRules: larger pieces are listed first.
+    """
+    moves = []
+
+    # Reserve placements, unless the opponent already shows a line
+    if not has_line(visible_mask(layers, 1 - color_index)):
+        for size in range(NUM_SIZES - 1, -1, -1):
+            if reserve_count(layers, color_index, size):
+                targets = FULL_MASK & ~cover_mask(layers, size)
+                for to_cell in range(NUM_CELLS):
+                    if targets >> to_cell & 1:
+                        moves.append((size, None, to_cell))
+
+    # Moves of top pieces already on the board
+    own_visible = visible_mask(layers, color_index)
+    for from_cell in range(NUM_CELLS):
+        bit = 1 << from_cell
+        if own_visible & bit:
+            size = top_size(layers, bit)
+            targets = FULL_MASK & ~cover_mask(layers, size) & ~bit
+            for to_cell in range(NUM_CELLS):
+                if targets >> to_cell & 1:
+                    moves.append((size, from_cell, to_cell))
+
+    return moves
+
+
+def play_move(layers, color_index, move):
+    """
+    Get the layers after a move, leaving the given layers untouched.
+    """
+    size, from_cell, to_cell = move
+    new_layers = list(layers)
+    index = layer_index(color_index, size)
+    if from_cell is not None:
+        new_layers[index] &= ~(1 << from_cell)
+    new_layers[index] |= 1 << to_cell
+    return tuple(new_layers)
+
+
+def outcome(layers):
+    """
+    Get the finished game state for the layers, or None if play continues.
+    Red is checked before blue, matching GobbletRules.make_move.
+    """
+    if has_line(visible_mask(layers, 0)):
+        return GameState.RED_WIN
+    if has_line(visible_mask(layers, 1)):
+        return GameState.BLUE_WIN
+    if occupied_mask(layers) == FULL_MASK:
+        return GameState.DRAW
+    return None
+
+
+class BitBoard(Board):
+    """
+    Board that mirrors its piece stacks as one 9-bit mask per color and size.
+    Move legality and fullness reduce to bitwise operations, and the layers can be
+    handed to the module-level helpers, while the grid of Piece stacks is kept for
+    code that needs the objects.
+    """
+    def __init__(self):
+        """
+        Initialize an empty board.
+        """
+        super().__init__()
+        self.layers = [0] * (len(PLAYER_COLORS) * NUM_SIZES)
+
+    def reset(self):
+        """
+        Reset the board to its initial empty state.
+        """
+        super().reset()
+        self.layers = [0] * (len(PLAYER_COLORS) * NUM_SIZES)
+
+    def is_valid_move(self, piece, row, col):
+        """
+        Check if placing the piece at the given position is valid.
+        """
+        if not (0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE):
+            return False
+        return not cover_mask(self.layers, piece.size) & cell_bit(row, col)
+
+    def place_piece(self, piece, row, col):
+        """
+        Place a piece on the board.
+        """
+        super().place_piece(piece, row, col)
+        self.layers[layer_index(COLOR_INDEX[piece.color], piece.size)] |= cell_bit(row, col)
+
+    def remove_piece(self, row, col):
+        """
+        Remove the top piece from the specified position.
+        """
+        piece = super().remove_piece(row, col)
+        if piece:
+            self.layers[layer_index(COLOR_INDEX[piece.color], piece.size)] &= ~cell_bit(row, col)
+        return piece
+
+    def is_full(self):
+        """
+        Check if all spaces on the board are filled.
+        """
+        return occupied_mask(self.layers) == FULL_MASK
+
+    def valid_targets(self, size):
+        """
+        Get the mask of squares a piece of the given size can be placed on.
+        """
+        return FULL_MASK & ~cover_mask(self.layers, size)
@@ -1,7 +1,20 @@
 # pylint: disable=no-member
 # pylint: disable=too-many-branches
 """Board class for the Gobblet Jr. game."""
-from .constants import BOARD_SIZE
+from .constants import BOARD_SIZE, RED, BLUE
+from .zobrist import PIECE_KEYS
+
+# The eight winning lines (rows, columns, diagonals) as lists of positions
+LINES = (
+    [[(row, col) for col in range(BOARD_SIZE)] for row in range(BOARD_SIZE)] +
+    [[(row, col) for row in range(BOARD_SIZE)] for col in range(BOARD_SIZE)] +
+    [[(i, i) for i in range(BOARD_SIZE)],
+     [(i, BOARD_SIZE - 1 - i) for i in range(BOARD_SIZE)]]
+)
+
+# Indices of the lines passing through each board position
+CELL_LINES = [[[index for index, line in enumerate(LINES) if (row, col) in line]
+               for col in range(BOARD_SIZE)] for row in range(BOARD_SIZE)]
 
 class Board:
     """
@@ -15,6 +28,8 @@ class Board:
         # Initialize board (3x3 grid of stacks)
         self.grid = [[[] for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
         self.last_move = None
+        self._reset_line_counts()
+        self.zobrist_hash = 0
 
     def reset(self):
         """
@@ -22,6 +37,27 @@ class Board:
         """
         self.grid = [[[] for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
         self.last_move = None
+        self._reset_line_counts()
+        self.zobrist_hash = 0
+
+    def _reset_line_counts(self):
+        """
+        Reset the per-line counters of top pieces owned by each color.
+        """
+        self.line_counts = {RED: [0] * len(LINES), BLUE: [0] * len(LINES)}
+        self.completed_lines = {RED: 0, BLUE: 0}
+
+    def _update_line_counts(self, piece, row, col, delta):
+        """
+        Add or remove a top piece from the counters of the lines through a position.
+        """
+        counts = self.line_counts[piece.color]
+        for index in CELL_LINES[row][col]:
+            if counts[index] == BOARD_SIZE:
+                self.completed_lines[piece.color] -= 1
+            counts[index] += delta
+            if counts[index] == BOARD_SIZE:
+                self.completed_lines[piece.color] += 1
 
     def get_top_piece(self, row, col):
         """
@@ -45,7 +81,12 @@ class Board:
         """
         Place a piece on the board.
         """
+        covered_piece = self.get_top_piece(row, col)
+        if covered_piece:
+            self._update_line_counts(covered_piece, row, col, -1)
         self.grid[row][col].append(piece)
+        self.zobrist_hash ^= PIECE_KEYS[piece.color][row][col][piece.size]
+        self._update_line_counts(piece, row, col, 1)
         piece.position = (row, col)
         self.last_move = (row, col)
 
@@ -54,9 +95,21 @@ class Board:
         Remove the top piece from the specified position.
         """
         if self.grid[row][col]:
-            return self.grid[row][col].pop()
+            piece = self.grid[row][col].pop()
+            self.zobrist_hash ^= PIECE_KEYS[piece.color][row][col][piece.size]
+            self._update_line_counts(piece, row, col, -1)
+            revealed_piece = self.get_top_piece(row, col)
+            if revealed_piece:
+                self._update_line_counts(revealed_piece, row, col, 1)
+            return piece
         return None
 
+    def has_line(self, color):
+        """
+        Check if the specified color shows a complete line of top pieces.
+        """
+        return self.completed_lines[color] > 0
+
     def is_full(self):
         """
         Check if all spaces on the board are filled.
@@ -1,10 +1,6 @@
 # pylint: disable=no-member
 # pylint: disable=too-many-branches
 """Constants for the Gobblet Jr. game."""
-import pygame
-
-# Initialize Pygame
-pygame.init()
 
 # Screen dimensions
 SCREEN_WIDTH = 1200
@@ -16,6 +12,9 @@ SQUARE_SIZE = 140
 BOARD_OFFSET_X = (SCREEN_WIDTH - BOARD_SIZE * SQUARE_SIZE) // 2
 BOARD_OFFSET_Y = (SCREEN_HEIGHT - BOARD_SIZE * SQUARE_SIZE) // 2
 
+# Pieces of each size in a player's starting reserve
+RESERVE_COUNT = 2
+
 # Piece sizes (radius in pixels)
 PIECE_SIZES = [20, 40, 60]
 
@@ -25,6 +24,21 @@ RESERVE_OFFSET_Y = 150
 RESERVE_SLOT_HEIGHT = 150
 RESERVE_SLOT_WIDTH = 150
 
+# Frames per second while something moves on screen
+FRAME_RATE = 60
+
+# Longest the game loop sleeps waiting for an event while the screen is still,
+# in milliseconds
+IDLE_WAIT_MS = 1000
+
+# Font file for all UI text, e.g. one bundled with the game; None uses
+# pygame's built-in font
+FONT_FILE = None
+
+# Computer player search budget per move in seconds; the search runs in a
+# worker process, so frames keep drawing while it thinks
+AI_TIME_BUDGET = 0.25
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -34,6 +48,7 @@ BLUE = (0, 0, 255)
 RED_TRANSPARENT = (255, 0, 0, 128)
 BLUE_TRANSPARENT = (0, 0, 255, 128)
 HIGHLIGHT = (255, 255, 0, 150)
+SELECTED_COLOR = (255, 200, 0)
 BACKGROUND = (240, 240, 220)
 LINE_COLOR = (50, 50, 50)
 SLOT_COLOR = (230, 230, 230)
@@ -1,8 +1,7 @@
 # pylint: disable=no-member
 # pylint: disable=too-many-branches
+# pylint: disable=too-few-public-methods
 """Piece class for the Gobblet Jr. game."""
-import pygame
-from .constants import BLACK, RED, RED_TRANSPARENT, BLUE_TRANSPARENT, PIECE_SIZES
 
 class Piece:
     """
@@ -22,19 +21,3 @@ class Piece:
         Check if this piece is larger than another piece.
         """
         return other_piece is None or self.size > other_piece.size
-
-    def draw(self, screen, x_coordinate, y_coordinate, transparent=False):
-        """
-        Draw the piece on the screen at the specified position.
-        """
-        color = self.color
-        if transparent:
-            if self.color == RED:
-                color = RED_TRANSPARENT
-            else:
-                color = BLUE_TRANSPARENT
-        pygame.draw.circle(screen, color, (x_coordinate, y_coordinate), PIECE_SIZES[self.size])
-        pygame.draw.circle(screen, BLACK, (x_coordinate, y_coordinate), PIECE_SIZES[self.size], 2)
-        # Draw a small black circle in the middle for visual distinction
-        if self.size > 0:  # For medium and large pieces
-            pygame.draw.circle(screen, BLACK, (x_coordinate, y_coordinate), 5)
@@ -2,6 +2,7 @@
 # pylint: disable=too-many-branches
 """Player class for the Gobblet Jr. game."""
 from .piece import Piece
+from .zobrist import RESERVE_KEYS
 
 class Player:
     """
@@ -14,6 +15,7 @@ class Player:
         """
         self.color = color
         self.reserve = []
+        self.zobrist_hash = 0
         self.initialize_pieces()
 
     def initialize_pieces(self):
@@ -25,6 +27,9 @@ class Player:
             Piece(self.color, 1), Piece(self.color, 1),  # Medium
             Piece(self.color, 0), Piece(self.color, 0)   # Small
         ]
+        self.zobrist_hash = 0
+        for size in range(3):
+            self.zobrist_hash ^= RESERVE_KEYS[self.color][size][self.count_pieces_of_size(size)]
 
     def get_piece_of_size(self, size):
         """
@@ -40,10 +45,22 @@ class Player:
         Remove a piece from the reserve.
         """
         if piece in self.reserve:
+            keys = RESERVE_KEYS[self.color][piece.size]
+            count = self.count_pieces_of_size(piece.size)
             self.reserve.remove(piece)
+            self.zobrist_hash ^= keys[count] ^ keys[count - 1]
             return True
         return False
 
+    def return_to_reserve(self, piece, slot):
+        """
+        Put a piece back into the reserve at the given slot.
+        """
+        keys = RESERVE_KEYS[self.color][piece.size]
+        count = self.count_pieces_of_size(piece.size)
+        self.reserve.insert(slot, piece)
+        self.zobrist_hash ^= keys[count] ^ keys[count + 1]
+
     def count_pieces_of_size(self, size):
         """
         Count the number of pieces of a given size in the reserve.
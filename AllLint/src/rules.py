@@ -0,0 +1,210 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""Headless rules for the Gobblet Jr. board game."""
+from .constants import RED, BLUE, BOARD_SIZE
+from .enums import GameState
+from .bitboard import (BitBoard, COLOR_INDEX, cell_bit, layer_index, visible_mask,
+                       has_line)
+from .player import Player
+from .zobrist import SIDE_KEY
+
+class GobbletRules:
+    """
+    Game state and move rules for Gobblet Jr. without any pygame dependency.
+    Manages the board, players, turn order, move generation and win detection.
+    """
+    def __init__(self):
+        """
+        Initialize the game state.
+        """
+        # Create components
+        self.board = BitBoard()
+        self.red_player = Player(RED)
+        self.blue_player = Player(BLUE)
+
+        # Game state
+        self.selected_piece = None
+        self.valid_moves = []
+        self.current_state = GameState.PLAYER_RED
+
+    def reset_game(self):
+        """
+        Reset the game to its initial state.
+        """
+        # Reset board
+        self.board.reset()
+
+        # Reset players
+        self.red_player.initialize_pieces()
+        self.blue_player.initialize_pieces()
+
+        # Reset game state
+        self.current_state = GameState.PLAYER_RED
+        self.selected_piece = None
+        self.valid_moves = []
+
+    def get_current_player(self):
+        """
+        Get the current player object.
+        """
+        if self.current_state == GameState.PLAYER_RED:
+            return self.red_player
+        return self.blue_player
+
+    def position_hash(self):
+        """
+        Get the 64-bit Zobrist hash of the stacks, reserves and side to move.
+        """
+        position_hash = (self.board.zobrist_hash ^ self.red_player.zobrist_hash ^
+                         self.blue_player.zobrist_hash)
+        if self.current_state == GameState.PLAYER_BLUE:
+            position_hash ^= SIDE_KEY
+        return position_hash
+
+    def select_piece(self, piece):
+        """
+        Select a piece and calculate its valid moves.
+        """
+        # Deselect previously selected piece
+        if self.selected_piece:
+            self.selected_piece.selected = False
+
+        # Select new piece
+        piece.selected = True
+        self.selected_piece = piece
+
+        # Calculate valid moves
+        self.valid_moves = self._get_valid_moves(piece)
+
+    def _get_valid_moves(self, piece):
+        """
+        Calculate all valid board positions for the selected piece.
+        """
+        # Squares not covered by an equal or larger piece
+        targets = self.board.valid_targets(piece.size)
+
+        # If the piece is in reserve, it can be placed on any valid square
+        if piece.position is None:
+            # Placing from reserve never depends on the target square, so the
+            # reveal check only needs to run once for the selected piece
+            if self._would_reveal_win_for_opponent(piece, None):
+                return []
+        else:
+            # If piece is on the board, it can be moved to any other valid square
+            targets &= ~cell_bit(*piece.position)
+            # Check if this move would reveal a winning line for the opponent
+            # if self._would_reveal_win_for_opponent(piece, piece.position):
+            #     return []
+
+        return [(row, col) for row in range(BOARD_SIZE) for col in range(BOARD_SIZE)
+                if targets & cell_bit(row, col)]
+
+    def _would_reveal_win_for_opponent(self, piece, from_pos):
+        """
+        Check if moving a piece would reveal a winning line for the opponent.
+        """
+        layers = self.board.layers
+
+        # Lift the piece off its current position if it's on top of a board stack
+        if from_pos and self.board.get_top_piece(*from_pos) is piece:
+            layers = list(layers)
+            layers[layer_index(COLOR_INDEX[piece.color], piece.size)] &= ~cell_bit(*from_pos)
+
+        # Check if removing the piece reveals a win for the opponent
+        opponent_color = BLUE if piece.color == RED else RED
+        return has_line(visible_mask(layers, COLOR_INDEX[opponent_color]))
+
+    def make_move(self, row, col):
+        """
+        Make a move with the selected piece to the specified position.
+        """
+        if not self.selected_piece or (row, col) not in self.valid_moves:
+            return False
+
+        piece = self.selected_piece
+
+        # Deselect the piece and clear valid moves
+        piece.selected = False
+        self.selected_piece = None
+        self.valid_moves = []
+
+        self.apply_move(piece, row, col)
+        return True
+
+    def legal_moves(self):
+        """
+        Get every (piece, row, col) move available to the current player.
+        Only one reserve piece of each size is listed, as they are interchangeable.
+        """
+        player = self.get_current_player()
+        pieces = [piece for piece in (player.get_piece_of_size(size) for size in (2, 1, 0))
+                  if piece]
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                piece = self.board.get_top_piece(row, col)
+                if piece and piece.color == player.color:
+                    pieces.append(piece)
+        return [(piece, row, col) for piece in pieces
+                for row, col in self._get_valid_moves(piece)]
+
+    def apply_move(self, piece, row, col):
+        """
+        Play a move in place without validating it.
+        Returns the information undo_move needs to restore the previous state.
+        """
+        from_pos = piece.position
+        reserve_slot = None
+
+        # If piece is coming from the board, remove it from its current position
+        if from_pos:
+            self.board.remove_piece(*from_pos)
+        else:
+            # If piece is coming from reserve, remember its slot and remove it
+            current_player = self.get_current_player()
+            reserve_slot = current_player.reserve.index(piece)
+            current_player.remove_from_reserve(piece)
+
+        undo = (piece, from_pos, reserve_slot, self.board.last_move, self.current_state)
+
+        # Add piece to the new position
+        self.board.place_piece(piece, row, col)
+
+        # Check for win conditions
+        if self._check_win(RED):
+            self.current_state = GameState.RED_WIN
+        elif self._check_win(BLUE):
+            self.current_state = GameState.BLUE_WIN
+        elif self.board.is_full():
+            self.current_state = GameState.DRAW
+        else:
+            # Switch players
+            if self.current_state == GameState.PLAYER_RED:
+                self.current_state = GameState.PLAYER_BLUE
+            else:
+                self.current_state = GameState.PLAYER_RED
+
+        return undo
+
+    def undo_move(self, undo):
+        """
+        Take back a move played with apply_move.
+        """
+        piece, from_pos, reserve_slot, last_move, state = undo
+        self.current_state = state
+
+        # Lift the piece off its destination, revealing whatever it covered
+        self.board.remove_piece(*piece.position)
+
+        if from_pos:
+            self.board.place_piece(piece, *from_pos)
+        else:
+            self.get_current_player().return_to_reserve(piece, reserve_slot)
+            piece.position = None
+
+        self.board.last_move = last_move
+
+    def _check_win(self, color):
+        """
+        Check if the specified color has won the game.
+        """
+        return self.board.has_line(color)
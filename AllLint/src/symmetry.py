@@ -0,0 +1,86 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""Board symmetries (rotations and reflections) for the Gobblet Jr. game."""
+from .constants import BOARD_SIZE
+from .bitboard import COLOR_INDEX, NUM_CELLS, FULL_MASK
+
+
+def _transform_cell(transform, cell):
+    """
+    Map a cell through one of the eight symmetries.
+    Transforms 0-3 rotate by 0, 90, 180 and 270 degrees; 4-7 mirror first.
+    """
+    row, col = divmod(cell, BOARD_SIZE)
+    if transform >= 4:
+        col = BOARD_SIZE - 1 - col
+    for _ in range(transform % 4):
+        row, col = col, BOARD_SIZE - 1 - row
+    return row * BOARD_SIZE + col
+
+
+# Destination cell of every cell under each transform
+CELL_MAPS = tuple(tuple(_transform_cell(transform, cell) for cell in range(NUM_CELLS))
+                  for transform in range(8))
+
+# Transform undoing each transform
+INVERSE = tuple(next(inverse for inverse in range(8)
+                     if all(CELL_MAPS[inverse][CELL_MAPS[transform][cell]] == cell
+                            for cell in range(NUM_CELLS)))
+                for transform in range(8))
+
+# Image of every 9-bit mask under each transform
+MASK_MAPS = tuple(
+    tuple(sum(1 << CELL_MAPS[transform][cell] for cell in range(NUM_CELLS) if mask >> cell & 1)
+          for mask in range(FULL_MASK + 1))
+    for transform in range(8)
+)
+
+
+def transform_layers(layers, transform):
+    """
+    Map every layer mask through a transform.
+    """
+    mask_map = MASK_MAPS[transform]
+    return tuple(mask_map[layer] for layer in layers)
+
+
+def canonicalize(layers):
+    """
+    Get the canonical representative of the layers and the transform reaching it.
+    Reserves and the side to move are unchanged by any symmetry, so the layers
+    alone decide the representative.
+    """
+    best = tuple(layers)
+    best_transform = 0
+    for transform in range(1, 8):
+        candidate = transform_layers(layers, transform)
+        if candidate < best:
+            best = candidate
+            best_transform = transform
+    return best, best_transform
+
+
+def canonicalize_game(game):
+    """
+    Get the canonical layers, the color to move and the transform for a game.
+    """
+    layers, transform = canonicalize(game.board.layers)
+    return layers, COLOR_INDEX[game.get_current_player().color], transform
+
+
+def transform_move(move, transform):
+    """
+    Map a (size, from_cell, to_cell) move through a transform.
+    """
+    size, from_cell, to_cell = move
+    cell_map = CELL_MAPS[transform]
+    if from_cell is not None:
+        from_cell = cell_map[from_cell]
+    return size, from_cell, cell_map[to_cell]
+
+
+def untransform_move(move, transform):
+    """
+    Map a move found in the canonical position back to the original position.
+    """
+    return transform_move(move, INVERSE[transform])
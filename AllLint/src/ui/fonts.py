@@ -0,0 +1,43 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""Shared font registry for the Gobblet Jr. game."""
+import pygame
+from ..constants import FONT_FILE
+
+class FontRegistry:
+    """
+    Loads each (family, size) font once and hands the same object to every caller.
+    The default family (None) comes from a font file when one is set, or else
+    from pygame's built-in font; neither scans the system fonts, so startup is
+    the same on every machine. Named families still go through SysFont.
+    """
+    def __init__(self, font_file=FONT_FILE):
+        """
+        Initialize an empty registry.
+        """
+        self.font_file = font_file
+        self.fonts = {}
+
+    def get(self, size, family=None):
+        """
+        Get the font of a family and size, loading it only the first time.
+        """
+        key = (family, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if family is None:
+                font = pygame.font.Font(self.font_file, size)
+            else:
+                font = pygame.font.SysFont(family, size)
+            self.fonts[key] = font
+        return font
+
+    def set_font_file(self, font_file):
+        """
+        Use a font file for the default family; fonts loaded before keep their old face.
+        """
+        self.font_file = font_file
+        self.fonts.clear()
+
+# Registry shared by the renderer and all UI components
+FONTS = FontRegistry()
@@ -0,0 +1,183 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-instance-attributes
+"""Frame-time profiler for the Gobblet Jr. game."""
+import csv
+import time
+from collections import deque
+import pygame
+from .fonts import FONTS
+
+# Frames the rolling percentiles cover
+PROFILE_WINDOW = 600
+
+# Frames between refreshes of the overlay's numbers
+OVERLAY_REFRESH_FRAMES = 30
+
+# Percentiles shown on the overlay
+OVERLAY_PERCENTILES = (50, 95, 99)
+
+# Overlay panel colors
+OVERLAY_BACKGROUND = (30, 30, 30)
+OVERLAY_TEXT = (220, 220, 220)
+
+class NullProfiler:
+    """
+    Profiler that records nothing, used when profiling is off.
+    """
+    def begin_frame(self):
+        """
+        Do nothing.
+        """
+
+    def lap(self, stage):
+        """
+        Do nothing.
+        """
+
+    def end_frame(self):
+        """
+        Do nothing.
+        """
+
+    def draw_overlay(self, screen, dirty):  # pylint: disable=unused-argument
+        """
+        Draw nothing; no screen rects are updated.
+        """
+        return []
+
+    def close(self):
+        """
+        Do nothing.
+        """
+
+class FrameProfiler:
+    """
+    Times the stages of each frame with perf_counter_ns.
+    Each lap(stage) call records the time since the previous lap, or since
+    begin_frame, under the stage's name. The last PROFILE_WINDOW frames give
+    rolling percentiles, which can be drawn as an overlay; every frame can
+    also be written as a CSV row of stage times in microseconds.
+    """
+    def __init__(self, overlay=True, csv_path=None):
+        """
+        Initialize the profiler, optionally writing every frame to a CSV file.
+        """
+        self.overlay = overlay
+        self.stages = []
+        self.samples = {}
+        self.frame_count = 0
+        self._frame = {}
+        self._last_lap = None
+        # Kept open until close(), so every frame is written as it ends
+        self._csv_file = None
+        self._csv_writer = None
+        if csv_path:
+            self._csv_file = open(csv_path, "w", newline="",  # pylint: disable=consider-using-with
+                                  encoding="utf-8")
+            self._csv_writer = csv.writer(self._csv_file)
+        self._csv_stages = None
+
+        # Overlay panel, redrawn every OVERLAY_REFRESH_FRAMES frames
+        self.font = FONTS.get(14, "monospace") if overlay else None
+        self.panel = None
+        self.panel_rect = None
+
+    def begin_frame(self):
+        """
+        Start timing a frame.
+        """
+        self._frame = {}
+        self._last_lap = time.perf_counter_ns()
+
+    def lap(self, stage):
+        """
+        Record the time since the previous lap as the given stage.
+        Laps outside a frame, such as drawing before the loop starts, are ignored.
+        """
+        if self._last_lap is None:
+            return
+        now = time.perf_counter_ns()
+        self._frame[stage] = self._frame.get(stage, 0) + now - self._last_lap
+        self._last_lap = now
+
+    def end_frame(self):
+        """
+        Add the frame's stage times and total to the rolling windows and the CSV file.
+        """
+        self._frame["frame"] = sum(self._frame.values())
+        self._last_lap = None
+        for stage in self._frame:
+            if stage not in self.samples:
+                self.stages.append(stage)
+                self.samples[stage] = deque(maxlen=PROFILE_WINDOW)
+        for stage in self.stages:
+            self.samples[stage].append(self._frame.get(stage, 0))
+
+        if self._csv_writer is not None:
+            # The columns are the stages of the first frame
+            if self._csv_stages is None:
+                self._csv_stages = list(self.stages)
+                self._csv_writer.writerow(["frame"] +
+                                          [f"{stage}_us" for stage in self._csv_stages])
+            self._csv_writer.writerow([self.frame_count] +
+                                      [self._frame.get(stage, 0) // 1000
+                                       for stage in self._csv_stages])
+        self.frame_count += 1
+
+    def percentiles(self, stage, percents=OVERLAY_PERCENTILES):
+        """
+        Get nearest-rank percentiles of a stage's recent times, in milliseconds.
+        """
+        ordered = sorted(self.samples.get(stage, ()))
+        if not ordered:
+            return [0.0] * len(percents)
+        return [ordered[max(0, -(-len(ordered) * percent // 100) - 1)] / 1e6
+                for percent in percents]
+
+    def draw_overlay(self, screen, dirty):
+        """
+        Draw the percentile panel in the top-left corner of the screen.
+        Returns the panel rect when it was drawn, for pygame.display.update.
+        """
+        if not self.overlay or not self.stages:
+            return []
+        refresh = self.panel is None or self.frame_count % OVERLAY_REFRESH_FRAMES == 0
+        if refresh:
+            self._build_panel()
+        elif self.panel_rect.collidelist(dirty) == -1:
+            return []
+        screen.blit(self.panel, self.panel_rect)
+        return [self.panel_rect]
+
+    def _build_panel(self):
+        """
+        Render the current percentiles onto the overlay panel.
+        """
+        header = "stage       " + "".join(f"  p{percent:<4d}" for percent in OVERLAY_PERCENTILES)
+        lines = [header + " ms"]
+        for stage in self.stages:
+            values = "".join(f"{value:7.2f}" for value in self.percentiles(stage))
+            lines.append(f"{stage:<12}{values}")
+
+        # The panel never shrinks, so each refresh covers the previous one
+        line_height = self.font.get_linesize()
+        width = max(self.font.size(line)[0] for line in lines) + 10
+        height = line_height * len(lines) + 10
+        if self.panel is not None:
+            width = max(width, self.panel.get_width())
+            height = max(height, self.panel.get_height())
+        self.panel = pygame.Surface((width, height))
+        self.panel.fill(OVERLAY_BACKGROUND)
+        for i, line in enumerate(lines):
+            self.panel.blit(self.font.render(line, True, OVERLAY_TEXT), (5, 5 + i * line_height))
+        self.panel_rect = self.panel.get_rect()
+
+    def close(self):
+        """
+        Finish the CSV file.
+        """
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
@@ -18,14 +18,20 @@ class InputHandler:
         """
         self.game = game
 
-    def handle_events(self):
+    def handle_events(self, events=None):
         """
         Handle pygame events (quit, key presses, mouse clicks).
+        events defaults to everything in the event queue.
         """
+        if events is None:
+            events = pygame.event.get()
         quit_game = False
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 quit_game = True
+            elif event.type == pygame.WINDOWEXPOSED:
+                # The window manager lost what was shown, so draw all of it again
+                self.game.renderer.invalidate()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
                     self.game.reset_game()
@@ -45,6 +51,10 @@ class InputHandler:
         if self.game.current_state in [GameState.RED_WIN, GameState.BLUE_WIN, GameState.DRAW]:
             return
 
+        # Ignore clicks while the computer player is to move
+        if self.game.is_ai_turn():
+            return
+
         current_player = self.game.get_current_player()
 
         # If a piece is already selected, only allow clicking on valid move positions
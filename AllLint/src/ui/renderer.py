@@ -1,6 +1,10 @@
 # pylint: disable=no-member
 # pylint: disable=too-many-branches
+# pylint: disable=too-many-instance-attributes
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-locals
 """Renderer for the Gobblet Jr. game."""
+import time
 import pygame
 from ..constants import (SCREEN_WIDTH, SCREEN_HEIGHT, BOARD_SIZE, SQUARE_SIZE,
                       BOARD_OFFSET_X, BOARD_OFFSET_Y, RESERVE_OFFSET_X,
@@ -8,45 +12,188 @@ from ..constants import (SCREEN_WIDTH, SCREEN_HEIGHT, BOARD_SIZE, SQUARE_SIZE,
                       WHITE, BLACK, GREY, RED, BLUE, HIGHLIGHT, BACKGROUND,
                       LINE_COLOR, SLOT_COLOR, SLOT_BORDER)
 from ..enums import GameState
+from .text_cache import TEXT_CACHE
+from .fonts import FONTS
+from .sprites import PieceAtlas
+from .frame_profiler import NullProfiler
+
+# Screen areas redrawn only when their contents change
+BOARD_RECT = pygame.Rect(BOARD_OFFSET_X, BOARD_OFFSET_Y, BOARD_SIZE * SQUARE_SIZE,
+                         BOARD_SIZE * SQUARE_SIZE).inflate(4, 4)
+RESERVE_RECTS = {
+    RED: pygame.Rect(RESERVE_OFFSET_X, RESERVE_OFFSET_Y,
+                     RESERVE_SLOT_WIDTH, 3 * RESERVE_SLOT_HEIGHT),
+    BLUE: pygame.Rect(SCREEN_WIDTH - RESERVE_OFFSET_X - RESERVE_SLOT_WIDTH, RESERVE_OFFSET_Y,
+                      RESERVE_SLOT_WIDTH, 3 * RESERVE_SLOT_HEIGHT),
+}
 
 class Renderer:
     """
     Handles all rendering for the Gobblet Jr. game.
     Responsible for drawing the board, pieces, and UI elements.
+    The scene is kept on an off-screen surface; each frame only the areas whose
+    contents changed are redrawn there and copied to the screen.
     """
-    def __init__(self, screen):
+    def __init__(self, screen, profiler=None):
         """
         Initialize the renderer.
+        profiler is an optional FrameProfiler that times each drawing step.
         """
         self.screen = screen
-        self.font = pygame.font.SysFont(None, 36)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.profiler = NullProfiler() if profiler is None else profiler
+        self.font = FONTS.get(36)
+        self.small_font = FONTS.get(24)
         self.size_labels = ["S", "M", "L"]
+        self.atlas = PieceAtlas()
 
-    def draw_game(self, game):
+        # Parts that never change, everything but the dragged piece, and what
+        # each area last showed
+        self.background = None
+        self.scene = None
+        self.status_y = 30
+        self.thinking_y = BOARD_OFFSET_Y - 40
+        self._area_keys = {}
+        # Text lines are sized by what was rendered, so each keeps the rect it last covered
+        self._text_rects = {}
+        self._drag_rect = None
+        self._full_redraw = True
+
+    def invalidate(self):
         """
-        Draw the entire game state.
+        Redraw the whole screen on the next frame.
         """
+        self._full_redraw = True
+
+    def _build_background(self):
+        """
+        Draw everything that is the same every frame onto the background surface.
+        """
+        self.background = pygame.Surface(self.screen.get_size()).convert(self.screen)
+
         # Fill the background
-        self.screen.fill(BACKGROUND)
+        self.background.fill(BACKGROUND)
 
-        # Draw the board
-        self._draw_board(game.board, game.selected_piece, game.valid_moves)
+        # Draw the board background and grid
+        self._draw_board_grid()
 
-        # Draw reserve areas with vertical slots
-        self._draw_reserve_area(RED, game.red_player.reserve)
-        self._draw_reserve_area(BLUE, game.blue_player.reserve)
+        # Draw empty reserve slots
+        self._draw_reserve_slots(RED)
+        self._draw_reserve_slots(BLUE)
 
         # Draw player labels for reserve areas
         self._draw_player_labels()
 
-        # Draw game status
-        self._draw_game_status(game.current_state)
-
         # Draw instructions
         self._draw_instructions()
 
-        self.draw_piece(game)
+    def draw_game(self, game):
+        """
+        Draw the parts of the game state that changed since the last frame.
+        Returns the screen rects that were updated, for pygame.display.update.
+        """
+        dirty = []
+        # Rebuild the background when the window size changes
+        if self.background is None or self.background.get_size() != self.screen.get_size():
+            self._build_background()
+            self.scene = self.background.copy()
+            self._full_redraw = True
+        if self._full_redraw:
+            self.scene.blit(self.background, (0, 0))
+            self._area_keys = {}
+            self._text_rects = {}
+            self._full_redraw = False
+            dirty.append(self.screen.get_rect())
+        self.profiler.lap("background")
+
+        # Draw the board
+        board_key = (tuple(self._top_piece_key(game.board.get_top_piece(row, col),
+                                               game.selected_piece)
+                           for row in range(BOARD_SIZE) for col in range(BOARD_SIZE)),
+                     game.board.last_move,
+                     tuple(game.valid_moves) if game.selected_piece else ())
+        if self._area_changed("board", board_key, BOARD_RECT, dirty):
+            self._draw_board(game.board, game.selected_piece, game.valid_moves)
+        self.profiler.lap("board")
+
+        # Draw reserve areas with vertical slots
+        for player in (game.red_player, game.blue_player):
+            selected_size = (game.selected_piece.size if game.selected_piece in player.reserve
+                             else None)
+            reserve_key = (tuple(sorted(piece.size for piece in player.reserve)), selected_size)
+            if self._area_changed(player.color, reserve_key, RESERVE_RECTS[player.color], dirty):
+                self._draw_reserve_area(player.color, player.reserve, game.selected_piece)
+        self.profiler.lap("reserves")
+
+        # Draw game status
+        if self._text_changed("status", game.current_state, dirty):
+            self._text_drawn("status", self._draw_game_status(game.current_state), dirty)
+        self.profiler.lap("status")
+        # The monotonic clock runs without pygame's timer subsystem, which is never started
+        thinking_key = int(time.monotonic() / 0.3) % 4 if game.is_ai_thinking() else None
+        if self._text_changed("thinking", thinking_key, dirty):
+            if thinking_key is not None:
+                self._text_drawn("thinking", self._draw_thinking(thinking_key), dirty)
+        self.profiler.lap("thinking")
+
+        # The dragged piece's old and new spots need the scene restored under them
+        drag_rect = self._selected_piece_rect(game)
+        if dirty or drag_rect != self._drag_rect:
+            dirty.extend(rect for rect in (self._drag_rect, drag_rect) if rect)
+        for rect in dirty:
+            self.screen.blit(self.scene, rect, rect)
+        if dirty:
+            self.draw_piece(game)
+        self._drag_rect = drag_rect
+        self.profiler.lap("compose")
+        return dirty
+
+    def _area_changed(self, name, key, rect, dirty):
+        """
+        Check if an area's contents changed; if so, restore its background and mark it dirty.
+        """
+        if name in self._area_keys and self._area_keys[name] == key:
+            return False
+        self._area_keys[name] = key
+        self.scene.blit(self.background, rect, rect)
+        dirty.append(rect)
+        return True
+
+    def _text_changed(self, name, key, dirty):
+        """
+        Check if a text line changed; if so, restore the background where it was last drawn.
+        """
+        if name in self._area_keys and self._area_keys[name] == key:
+            return False
+        self._area_keys[name] = key
+        rect = self._text_rects.pop(name, None)
+        if rect:
+            self.scene.blit(self.background, rect, rect)
+            dirty.append(rect)
+        return True
+
+    def _text_drawn(self, name, rect, dirty):
+        """
+        Remember the rect a text line was drawn in and mark it dirty.
+        """
+        self._text_rects[name] = rect
+        dirty.append(rect)
+
+    @staticmethod
+    def _top_piece_key(piece, selected_piece):
+        """
+        Get what is drawn for a board square's top piece.
+        """
+        return (piece.color, piece.size, piece is selected_piece) if piece else None
+
+    def _selected_piece_rect(self, game):
+        """
+        Get the screen area covered by the selected piece at the mouse, if any.
+        """
+        if not game.selected_piece:
+            return None
+        rect = self.atlas.sprite_rect(game.selected_piece, pygame.mouse.get_pos(),
+                                      transparent=True)
+        return rect.clip(self.screen.get_rect())
 
     def draw_piece(self, game):
         """
@@ -54,36 +201,49 @@ class Renderer:
         """
         if game.selected_piece:
             mouse_pos = pygame.mouse.get_pos()
-            game.selected_piece.draw(self.screen, mouse_pos[0], mouse_pos[1], transparent=True)
+            self._draw_piece(game.selected_piece, mouse_pos[0], mouse_pos[1], transparent=True,
+                             surface=self.screen)
 
-    def _draw_board(self, board, selected_piece, valid_moves):
+    def _draw_piece(self, piece, x_coordinate, y_coordinate, *, transparent=False,
+                    surface=None, selected=False):
         """
-        Draw the game board and pieces.
+        Draw a piece at the specified position, on the scene unless another surface is given.
+        """
+        surface = self.scene if surface is None else surface
+        self.atlas.draw(surface, piece, (x_coordinate, y_coordinate), transparent, selected)
+
+    def _draw_board_grid(self):
+        """
+        Draw the empty board and its grid lines onto the background.
         """
         # Draw the board background
-        pygame.draw.rect(self.screen, WHITE,
+        pygame.draw.rect(self.background, WHITE,
                         (BOARD_OFFSET_X, BOARD_OFFSET_Y,
                          BOARD_SIZE * SQUARE_SIZE, BOARD_SIZE * SQUARE_SIZE))
 
         # Draw grid lines
         for i in range(BOARD_SIZE + 1):
             # Horizontal lines
-            pygame.draw.line(self.screen, LINE_COLOR,
+            pygame.draw.line(self.background, LINE_COLOR,
                            (BOARD_OFFSET_X, BOARD_OFFSET_Y + i * SQUARE_SIZE),
                            (BOARD_OFFSET_X + BOARD_SIZE * SQUARE_SIZE,
                             BOARD_OFFSET_Y + i * SQUARE_SIZE),
                            2)
             # Vertical lines
-            pygame.draw.line(self.screen, LINE_COLOR,
+            pygame.draw.line(self.background, LINE_COLOR,
                            (BOARD_OFFSET_X + i * SQUARE_SIZE, BOARD_OFFSET_Y),
                            (BOARD_OFFSET_X + i * SQUARE_SIZE,
                             BOARD_OFFSET_Y + BOARD_SIZE * SQUARE_SIZE),
                            2)
 
+    def _draw_board(self, board, selected_piece, valid_moves):
+        """
+        Draw the board highlights and pieces over the background.
+        """
         # Highlight the last move
         if board.last_move:
             row, col = board.last_move
-            pygame.draw.rect(self.screen, GREY,
+            pygame.draw.rect(self.scene, GREY,
                            (BOARD_OFFSET_X + col * SQUARE_SIZE,
                             BOARD_OFFSET_Y + row * SQUARE_SIZE,
                             SQUARE_SIZE, SQUARE_SIZE))
@@ -91,7 +251,7 @@ class Renderer:
         # Highlight valid moves for selected piece
         if selected_piece:
             for row, col in valid_moves:
-                pygame.draw.rect(self.screen, HIGHLIGHT,
+                pygame.draw.rect(self.scene, HIGHLIGHT,
                                (BOARD_OFFSET_X + col * SQUARE_SIZE,
                                 BOARD_OFFSET_Y + row * SQUARE_SIZE,
                                 SQUARE_SIZE, SQUARE_SIZE))
@@ -104,59 +264,76 @@ class Renderer:
 
                 piece = board.get_top_piece(row, col)
                 if piece:
-                    piece.draw(self.screen, square_center_x, square_center_y)
+                    self._draw_piece(piece, square_center_x, square_center_y,
+                                     selected=piece is selected_piece)
 
-    def _draw_reserve_area(self, color, reserves):
+    @staticmethod
+    def _reserve_x(color):
         """
-        Draw reserve area for the specified color.
+        Get the left edge of a color's reserve slots.
         """
         # Position differs based on player color
-        is_blue = color == BLUE
-        if is_blue:
-            base_x = SCREEN_WIDTH - RESERVE_OFFSET_X - RESERVE_SLOT_WIDTH
-        else:
-            base_x = RESERVE_OFFSET_X
+        if color == BLUE:
+            return SCREEN_WIDTH - RESERVE_OFFSET_X - RESERVE_SLOT_WIDTH
+        return RESERVE_OFFSET_X
+
+    def _draw_reserve_slots(self, color):
+        """
+        Draw the empty reserve slots and their size labels onto the background.
+        """
+        slot_x = self._reserve_x(color)
 
         # Draw slots for each size (L, M, S)
         for i, size in enumerate([2, 1, 0]):
             # Draw slot
-            slot_x = base_x
             slot_y = RESERVE_OFFSET_Y + i * RESERVE_SLOT_HEIGHT
-            pygame.draw.rect(self.screen, SLOT_COLOR,
+            pygame.draw.rect(self.background, SLOT_COLOR,
                            (slot_x, slot_y, RESERVE_SLOT_WIDTH, RESERVE_SLOT_HEIGHT))
-            pygame.draw.rect(self.screen, SLOT_BORDER,
+            pygame.draw.rect(self.background, SLOT_BORDER,
                            (slot_x, slot_y, RESERVE_SLOT_WIDTH, RESERVE_SLOT_HEIGHT), 2)
 
             # Draw size label
-            size_label = self.small_font.render(self.size_labels[size], True, BLACK)
-            self.screen.blit(size_label, (slot_x + 10, slot_y + 5))
+            size_label = TEXT_CACHE.render(self.small_font, self.size_labels[size], BLACK)
+            self.background.blit(size_label, (slot_x + 10, slot_y + 5))
+
+    def _draw_reserve_area(self, color, reserves, selected_piece=None):
+        """
+        Draw the reserve counts and pieces for the specified color over the background.
+        """
+        slot_x = self._reserve_x(color)
+
+        for i, size in enumerate([2, 1, 0]):
+            slot_y = RESERVE_OFFSET_Y + i * RESERVE_SLOT_HEIGHT
 
             # Draw counter for how many pieces of this size are in reserve
             count = sum(1 for piece in reserves if piece.size == size)
-            count_label = self.small_font.render(f"x{count}", True, color)
-            self.screen.blit(count_label, (slot_x + RESERVE_SLOT_WIDTH - 30, slot_y + 5))
+            count_label = TEXT_CACHE.render(self.small_font, f"x{count}", color)
+            self.scene.blit(count_label, (slot_x + RESERVE_SLOT_WIDTH - 30, slot_y + 5))
 
             # Draw the pieces in this slot
             for piece in reserves:
                 if piece.size == size:
                     piece_x = slot_x + RESERVE_SLOT_WIDTH // 2
                     piece_y = slot_y + RESERVE_SLOT_HEIGHT // 2
-                    piece.draw(self.screen, piece_x, piece_y)
+                    self._draw_piece(piece, piece_x, piece_y,
+                                     selected=selected_piece in reserves and
+                                     selected_piece.size == size)
                     break  # Just draw one piece per slot as representative
 
     def _draw_player_labels(self):
         """
         Draw player labels for reserve areas.
         """
-        red_label = self.font.render("RED PIECES", True, RED)
-        blue_label = self.font.render("BLUE PIECES", True, BLUE)
-        self.screen.blit(red_label, (RESERVE_OFFSET_X, RESERVE_OFFSET_Y - 50))
-        self.screen.blit(blue_label, (SCREEN_WIDTH - RESERVE_OFFSET_X
+        red_label = TEXT_CACHE.render(self.font, "RED PIECES", RED)
+        blue_label = TEXT_CACHE.render(self.font, "BLUE PIECES", BLUE)
+        self.background.blit(red_label, (RESERVE_OFFSET_X, RESERVE_OFFSET_Y - 50))
+        self.background.blit(blue_label, (SCREEN_WIDTH - RESERVE_OFFSET_X
                                      - blue_label.get_width(), RESERVE_OFFSET_Y - 50))
 
     def _draw_game_status(self, current_state):
         """
         Draw the current game status.
+        Returns the rect drawn in.
         """
         status_text = ""
         text_color = BLACK
@@ -177,19 +354,31 @@ class Renderer:
             status_text = "Draw!"
             text_color = BLACK
 
-        status_surface = self.font.render(status_text, True, text_color)
-        self.screen.blit(status_surface, (SCREEN_WIDTH // 2 - status_surface.get_width() // 2, 30))
+        status_surface = TEXT_CACHE.render(self.font, status_text, text_color)
+        return self.scene.blit(status_surface,
+                               status_surface.get_rect(midtop=(SCREEN_WIDTH // 2, self.status_y)))
+
+    def _draw_thinking(self, dot_count):
+        """
+        Draw an animated indicator while the computer player searches.
+        Returns the rect drawn in.
+        """
+        dots = "." * dot_count
+        thinking_surface = TEXT_CACHE.render(self.small_font, f"Computer is thinking{dots}", BLACK)
+        return self.scene.blit(thinking_surface,
+                               thinking_surface.get_rect(midtop=(SCREEN_WIDTH // 2,
+                                                                 self.thinking_y)))
 
     def _draw_instructions(self):
         """
         Draw game instructions.
         """
         instructions = "Click on a piece slot to select, then click on a valid square to move"
-        instructions_surface = self.small_font.render(instructions, True, BLACK)
-        self.screen.blit(instructions_surface,
+        instructions_surface = TEXT_CACHE.render(self.small_font, instructions, BLACK)
+        self.background.blit(instructions_surface,
                         (SCREEN_WIDTH // 2 - instructions_surface.get_width() // 2, 70))
 
         reset_text = "Press 'R' to reset the game"
-        reset_surface = self.small_font.render(reset_text, True, BLACK)
-        self.screen.blit(reset_surface,
+        reset_surface = TEXT_CACHE.render(self.small_font, reset_text, BLACK)
+        self.background.blit(reset_surface,
                         (SCREEN_WIDTH // 2 - reset_surface.get_width() // 2, SCREEN_HEIGHT - 30))
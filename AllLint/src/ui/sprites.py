@@ -0,0 +1,73 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""Pre-rendered piece sprites for the Gobblet Jr. game."""
+import pygame
+from ..constants import (RED, BLACK, PIECE_SIZES, RED_TRANSPARENT, BLUE_TRANSPARENT,
+                         SELECTED_COLOR)
+
+# Sprites are drawn this many times larger, then smoothly scaled down for anti-aliasing
+SPRITE_SCALE = 4
+
+# Room around a piece for the selection ring, in pixels
+SPRITE_PADDING = 5
+
+def _render_piece(color, size, transparent, selected):
+    """
+    Render one piece to a per-pixel alpha surface.
+    """
+    if transparent:
+        color = RED_TRANSPARENT if color == RED else BLUE_TRANSPARENT
+    radius = PIECE_SIZES[size]
+    half = (radius + SPRITE_PADDING) * SPRITE_SCALE
+    large = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
+    center = (half, half)
+
+    # Selection ring outside the piece
+    if selected:
+        pygame.draw.circle(large, SELECTED_COLOR, center,
+                           (radius + SPRITE_PADDING) * SPRITE_SCALE, 3 * SPRITE_SCALE)
+    pygame.draw.circle(large, color, center, radius * SPRITE_SCALE)
+    pygame.draw.circle(large, BLACK, center, radius * SPRITE_SCALE, 2 * SPRITE_SCALE)
+    # Draw a small black circle in the middle for visual distinction
+    if size > 0:  # For medium and large pieces
+        pygame.draw.circle(large, BLACK, center, 5 * SPRITE_SCALE)
+
+    sprite = pygame.transform.smoothscale(large, (2 * half // SPRITE_SCALE,
+                                                  2 * half // SPRITE_SCALE))
+    return sprite.convert_alpha() if pygame.display.get_surface() else sprite
+
+class PieceAtlas:
+    """
+    Sprites of every (color, size, transparent, selected) piece, each rendered
+    the first time it is drawn, so startup only pays for the sprites on screen.
+    Drawing a piece is then a single blit, and transparent pieces keep their alpha.
+    """
+    def __init__(self):
+        """
+        Initialize an empty atlas.
+        """
+        self.sprites = {}
+
+    def sprite(self, piece, transparent=False, selected=False):
+        """
+        Get a piece's sprite, rendering it on first use.
+        """
+        key = (piece.color, piece.size, transparent, selected)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = _render_piece(*key)
+            self.sprites[key] = sprite
+        return sprite
+
+    def sprite_rect(self, piece, center, transparent=False, selected=False):
+        """
+        Get the screen area a piece's sprite covers when centered on a point.
+        """
+        return self.sprite(piece, transparent, selected).get_rect(center=center)
+
+    def draw(self, surface, piece, center, transparent=False, selected=False):
+        """
+        Blit a piece's sprite centered on a point and return the area it covers.
+        """
+        sprite = self.sprite(piece, transparent, selected)
+        return surface.blit(sprite, sprite.get_rect(center=center))
@@ -0,0 +1,43 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""Cache of rendered text surfaces for the Gobblet Jr. game."""
+from collections import OrderedDict
+
+# Text surfaces kept before the least recently used one is dropped
+TEXT_CACHE_SIZE = 256
+
+class TextCache:
+    """
+    Least-recently-used cache of rendered text, keyed by (font, text, color).
+    Labels that rarely change are rasterized once instead of every frame.
+    """
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+        """
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+
+    def render(self, font, text, color):
+        """
+        Get the antialiased surface of a text, rendering it only on a cache miss.
+        """
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+    def clear(self):
+        """
+        Drop every cached surface.
+        """
+        self.surfaces.clear()
+
+# Cache shared by the renderer and the UI components
+TEXT_CACHE = TextCache()
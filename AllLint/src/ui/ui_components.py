@@ -1,9 +1,13 @@
 # pylint: disable=no-member
 # pylint: disable=too-many-branches
 # pylint: disable=too-many-arguments
+# pylint: disable=too-many-instance-attributes
 """UI components for the Gobblet Jr. game."""
+import time
 import pygame
 from ..constants import (WHITE, BLACK, GREY)
+from .text_cache import TEXT_CACHE
+from .fonts import FONTS
 
 class Button:
     """
@@ -20,7 +24,7 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
-        self.font = pygame.font.SysFont(None, 30)
+        self.font = FONTS.get(30)
         self.is_hovered = False
 
     def draw(self, screen):
@@ -35,7 +39,7 @@ class Button:
         pygame.draw.rect(screen, BLACK, self.rect, 2)  # Border
 
         # Draw text
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = TEXT_CACHE.render(self.font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -55,55 +59,65 @@ class GameDialog:
     """
     A dialog box for displaying messages.
     Used for game state notifications and confirmations.
+    The dimming overlay and the dialog box with its title and message are built
+    once and reused; they are rebuilt only when the message or screen size changes.
     """
     def __init__(self, width, height, message, title="Message"):
         """
         Initialize a dialog box.
         """
         self.rect = pygame.Rect(0, 0, width, height)
-        self.rect.center = (pygame.display.get_surface().get_width() // 2,
-                          pygame.display.get_surface().get_height() // 2)
         self.title = title
         self.message = message
-        self.title_font = pygame.font.SysFont(None, 36)
-        self.message_font = pygame.font.SysFont(None, 28)
-        self.ok_button = Button(
-            self.rect.centerx - 50,
-            self.rect.bottom - 60,
-            100, 40, "OK", GREY, WHITE
-        )
+        self.title_font = FONTS.get(36)
+        self.message_font = FONTS.get(28)
+        self.ok_button = Button(0, 0, 100, 40, "OK", GREY, WHITE)
+        self._center(pygame.display.get_surface().get_size())
         self.visible = False
 
-    def draw(self, screen):
+        # Cached surfaces and what they were built for
+        self._overlay = None
+        self._box = None
+        self._box_key = None
+
+    def _center(self, screen_size):
         """
-        Draw the dialog if visible.
+        Center the dialog and its OK button on a screen of the given size.
         """
-        if not self.visible:
-            return
+        self.rect.center = (screen_size[0] // 2, screen_size[1] // 2)
+        self.ok_button.rect.topleft = (self.rect.centerx - 50, self.rect.bottom - 60)
 
-        # Semi-transparent background overlay
-        overlay = pygame.Surface((pygame.display.get_surface().get_width(),
-                                pygame.display.get_surface().get_height()),
-                               pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        screen.blit(overlay, (0, 0))
+    def _build_overlay(self, screen):
+        """
+        Build the semi-transparent overlay that dims the screen behind the dialog.
+        """
+        # One alpha for the whole surface blends faster than per-pixel alpha
+        self._overlay = pygame.Surface(screen.get_size()).convert(screen)
+        self._overlay.fill(BLACK)
+        self._overlay.set_alpha(128)
+        self._center(screen.get_size())
+
+    def _build_box(self):
+        """
+        Draw the dialog box with its title, divider and message onto one surface.
+        """
+        self._box = pygame.Surface(self.rect.size)
+        box_rect = self._box.get_rect()
 
         # Dialog background
-        pygame.draw.rect(screen, WHITE, self.rect)
-        pygame.draw.rect(screen, BLACK, self.rect, 2)
+        self._box.fill(WHITE)
+        pygame.draw.rect(self._box, BLACK, box_rect, 2)
 
         # Title
         title_surface = self.title_font.render(self.title, True, BLACK)
-        title_rect = title_surface.get_rect(
-            center=(self.rect.centerx, self.rect.top + 30)
-        )
-        screen.blit(title_surface, title_rect)
+        title_rect = title_surface.get_rect(center=(box_rect.centerx, 30))
+        self._box.blit(title_surface, title_rect)
 
         # Divider line
         pygame.draw.line(
-            screen, GREY,
-            (self.rect.left + 20, self.rect.top + 60),
-            (self.rect.right - 20, self.rect.top + 60),
+            self._box, GREY,
+            (box_rect.left + 20, 60),
+            (box_rect.right - 20, 60),
             2
         )
 
@@ -111,10 +125,26 @@ class GameDialog:
         lines = self.message.split('\n')
         for i, line in enumerate(lines):
             msg_surface = self.message_font.render(line, True, BLACK)
-            msg_rect = msg_surface.get_rect(
-                center=(self.rect.centerx, self.rect.top + 100 + i * 30)
-            )
-            screen.blit(msg_surface, msg_rect)
+            msg_rect = msg_surface.get_rect(center=(box_rect.centerx, 100 + i * 30))
+            self._box.blit(msg_surface, msg_rect)
+        self._box_key = (self.title, self.message, self.rect.size)
+
+    def draw(self, screen):
+        """
+        Draw the dialog if visible.
+        """
+        if not self.visible:
+            return
+
+        # Semi-transparent background overlay
+        if self._overlay is None or self._overlay.get_size() != screen.get_size():
+            self._build_overlay(screen)
+        screen.blit(self._overlay, (0, 0))
+
+        # Dialog box with title and message
+        if self._box_key != (self.title, self.message, self.rect.size):
+            self._build_box()
+        screen.blit(self._box, self.rect)
 
         # OK button
         self.ok_button.draw(screen)
@@ -147,7 +177,7 @@ class PieceCounter:
         self.x_coordinate = x_coordinate
         self.y_coordinate = y_coordinate
         self.color = color
-        self.font = pygame.font.SysFont(None, 24)
+        self.font = FONTS.get(24)
 
     def draw(self, screen, piece_counts):
         """
@@ -165,7 +195,7 @@ class PieceCounter:
         """
         labels = ["Small", "Medium", "Large"]
         label = f"{labels[idx]}: {count}"
-        text_surface = self.font.render(label, True, self.color)
+        text_surface = TEXT_CACHE.render(self.font, label, self.color)
         return text_surface
 
 class Timer:
@@ -179,25 +209,26 @@ class Timer:
         """
         self.x_coordinate = x_coordinate
         self.y_coordinate = y_coordinate
-        self.font = pygame.font.SysFont(None, 24)
-        self.start_time = pygame.time.get_ticks()
+        self.font = FONTS.get(24)
+        # Monotonic seconds, as pygame's timer subsystem is never started
+        self.start_time = time.monotonic()
         self.turn_start_time = self.start_time
 
     def reset_turn_timer(self):
         """
         Reset the turn timer.
         """
-        self.turn_start_time = pygame.time.get_ticks()
+        self.turn_start_time = time.monotonic()
 
     def draw(self, screen):
         """
         Draw the timer display.
         """
-        current_time = pygame.time.get_ticks()
+        current_time = time.monotonic()
 
-        # Calculate times in seconds
-        total_time = (current_time - self.start_time) // 1000
-        turn_time = (current_time - self.turn_start_time) // 1000
+        # Calculate times in whole seconds
+        total_time = int(current_time - self.start_time)
+        turn_time = int(current_time - self.turn_start_time)
 
         # Format times as MM:SS
         total_time_str = f"{total_time // 60:02d}:{total_time % 60:02d}"
@@ -207,8 +238,8 @@ class Timer:
         total_label = f"Game Time: {total_time_str}"
         turn_label = f"Turn Time: {turn_time_str}"
 
-        total_surface = self.font.render(total_label, True, BLACK)
-        turn_surface = self.font.render(turn_label, True, BLACK)
+        total_surface = TEXT_CACHE.render(self.font, total_label, BLACK)
+        turn_surface = TEXT_CACHE.render(self.font, turn_label, BLACK)
 
         screen.blit(total_surface, (self.x_coordinate, self.y_coordinate))
         screen.blit(turn_surface, (self.x_coordinate, self.y_coordinate + 25))
@@ -0,0 +1,25 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""Zobrist keys for hashing Gobblet Jr. positions."""
+import random
+from .constants import BOARD_SIZE, RED, BLUE, RESERVE_COUNT
+
+# Fixed seed so hashes are stable across processes and runs
+_RANDOM = random.Random(0x60BB1E7)
+
+# Key for each (color, row, col, size) piece on the board
+PIECE_KEYS = {
+    color: [[[_RANDOM.getrandbits(64) for _ in range(3)]
+             for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+    for color in (RED, BLUE)
+}
+
+# Key for each (color, size, count) reserve slot
+RESERVE_KEYS = {
+    color: [[_RANDOM.getrandbits(64) for _ in range(RESERVE_COUNT + 1)]
+            for _ in range(3)]
+    for color in (RED, BLUE)
+}
+
+# Key mixed in when blue is to move
+SIDE_KEY = _RANDOM.getrandbits(64)
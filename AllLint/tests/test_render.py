@@ -0,0 +1,61 @@
+# pylint: disable=no-member
+"""Checks that the Gobblet Jr. renderer's incremental frames match a full redraw."""
+import os
+import random
+import time
+import pygame
+import pytest
+from src.enums import GameState
+from src.game import GobbletJr
+from src.ui.renderer import Renderer
+
+# Random frames drawn in each check
+FRAMES = 200
+
+
+@pytest.fixture(name="game")
+def fixture_game():
+    """
+    Create a game on a headless display.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    yield GobbletJr()
+    pygame.quit()
+
+
+def full_redraw(game):
+    """
+    Draw the game with a fresh renderer onto a new surface.
+    """
+    surface = pygame.Surface(game.screen.get_size())
+    Renderer(surface).draw_game(game)
+    return pygame.image.tobytes(surface, "RGB")
+
+
+def test_incremental_frames_match_full_redraw(game, monkeypatch):
+    """
+    Play random moves, drags and thinking-indicator changes and compare every frame.
+    """
+    rng = random.Random(3)
+    state = {"thinking": False, "mouse": (0, 0), "clock": 0.0}
+    monkeypatch.setattr(game, "is_ai_thinking", lambda: state["thinking"])
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: state["mouse"])
+    monkeypatch.setattr(time, "monotonic", lambda: state["clock"])
+
+    for frame in range(FRAMES):
+        if game.current_state not in (GameState.PLAYER_RED, GameState.PLAYER_BLUE):
+            game.reset_game()
+        elif game.selected_piece and game.valid_moves and rng.random() < 0.5:
+            game.make_move(*rng.choice(game.valid_moves))
+        elif rng.random() < 0.4 and game.legal_moves():
+            game.select_piece(rng.choice(game.legal_moves())[0])
+        if rng.random() < 0.2:
+            state["thinking"] = not state["thinking"]
+        state["mouse"] = (rng.randrange(game.screen.get_width()),
+                          rng.randrange(game.screen.get_height()))
+        state["clock"] += rng.random()
+
+        game.renderer.draw_game(game)
+        assert pygame.image.tobytes(game.screen, "RGB") == full_redraw(game), f"frame {frame}"
@@ -0,0 +1,172 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-locals
+"""Checks that the Gobblet Jr. rules engines agree with each other."""
+import random
+import pytest
+from src.constants import BOARD_SIZE
+from src.enums import GameState
+from src.rules import GobbletRules
+from src.bitboard import (COLOR_INDEX, NUM_SIZES, NUM_CELLS, layer_index, generate_moves,
+                          play_move, outcome, top_size)
+
+# Random games played in each check
+GAMES = 200
+
+# Games still running after this many plies are left unfinished
+MAX_PLIES = 60
+
+
+def random_games(seed):
+    """
+    Play random games through GobbletRules, yielding the game before every move.
+    """
+    rng = random.Random(seed)
+    for _ in range(GAMES):
+        game = GobbletRules()
+        for _ in range(MAX_PLIES):
+            if game.current_state not in (GameState.PLAYER_RED, GameState.PLAYER_BLUE):
+                break
+            moves = game.legal_moves()
+            if not moves:
+                break
+            yield game, moves
+            game.apply_move(*rng.choice(moves))
+
+
+def grid_layers(board):
+    """
+    Rebuild the bitboard layers from the board's grid of piece stacks.
+    """
+    layers = [0] * (2 * NUM_SIZES)
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            for piece in board.grid[row][col]:
+                layers[layer_index(COLOR_INDEX[piece.color], piece.size)] |= (
+                    1 << (row * BOARD_SIZE + col))
+    return layers
+
+
+def rules_moves(moves):
+    """
+    Convert GobbletRules (piece, row, col) moves to bitboard (size, from_cell, to_cell) moves.
+    """
+    return {(piece.size,
+             None if piece.position is None
+             else piece.position[0] * BOARD_SIZE + piece.position[1],
+             row * BOARD_SIZE + col)
+            for piece, row, col in moves}
+
+
+def color_to_move(game):
+    """
+    Get the layer color index of the player to move.
+    """
+    return COLOR_INDEX[game.get_current_player().color]
+
+
+def snapshot(game):
+    """
+    Capture everything apply_move and undo_move touch.
+    """
+    board = game.board
+    return (list(board.layers),
+            [[list(stack) for stack in row] for row in board.grid],
+            [[[piece.position for piece in stack] for stack in row] for row in board.grid],
+            list(game.red_player.reserve), list(game.blue_player.reserve),
+            [piece.position for piece in game.red_player.reserve + game.blue_player.reserve],
+            {color: list(counts) for color, counts in board.line_counts.items()},
+            dict(board.completed_lines),
+            board.last_move, game.current_state, game.position_hash())
+
+
+def test_apply_undo_round_trip():
+    """
+    Undoing any legal move restores the exact previous state.
+    """
+    for game, moves in random_games(seed=1):
+        before = snapshot(game)
+        for move in moves:
+            game.undo_move(game.apply_move(*move))
+            assert snapshot(game) == before
+
+
+def test_layers_match_grid():
+    """
+    The bitboard layers always describe the same stacks as the grid.
+    """
+    for game, _ in random_games(seed=2):
+        board = game.board
+        assert board.layers == grid_layers(board)
+        full = all(board.grid[row][col] for row in range(BOARD_SIZE) for col in range(BOARD_SIZE))
+        assert board.is_full() == full
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                piece = board.get_top_piece(row, col)
+                size = top_size(board.layers, 1 << (row * BOARD_SIZE + col))
+                assert size == (piece.size if piece else None)
+
+
+def test_bitboard_matches_rules():
+    """
+    Bitboard move generation, play and scoring match GobbletRules.
+    """
+    for game, moves in random_games(seed=3):
+        layers = tuple(game.board.layers)
+        color_index = color_to_move(game)
+        assert set(generate_moves(layers, color_index)) == rules_moves(moves)
+        assert outcome(layers) is None
+        for piece, row, col in moves:
+            move = rules_moves([(piece, row, col)]).pop()
+            undo = game.apply_move(piece, row, col)
+            child = play_move(layers, color_index, move)
+            assert child == tuple(game.board.layers)
+            expected = outcome(child)
+            if expected is None:
+                assert game.current_state in (GameState.PLAYER_RED, GameState.PLAYER_BLUE)
+                assert color_to_move(game) == 1 - color_index
+            else:
+                assert game.current_state == expected
+            game.undo_move(undo)
+
+
+def test_batch_matches_bitboard():
+    """
+    The NumPy batch simulator's moves and results match src/bitboard.py.
+    """
+    batch = pytest.importorskip("src.ai.batch")
+    games = batch.BatchGames(GAMES, seed=4)
+    states = {batch.RED_WIN: GameState.RED_WIN, batch.BLUE_WIN: GameState.BLUE_WIN,
+              batch.DRAW: GameState.DRAW}
+    for _ in range(MAX_PLIES):
+        ongoing = [index for index in range(GAMES) if games.state[index] == batch.ONGOING]
+        if not ongoing:
+            break
+        legal = games.legal_moves()
+        before = {}
+        for index in ongoing:
+            layers = games.game_layers(index)
+            color_index = int(games.side[index])
+            expected = set(generate_moves(layers, color_index))
+            found = set()
+            for move_id in legal[index].nonzero()[0]:
+                source, to_cell = divmod(int(move_id), NUM_CELLS)
+                if source < NUM_SIZES:
+                    found.add((source, None, to_cell))
+                else:
+                    from_cell = source - NUM_SIZES
+                    found.add((top_size(layers, 1 << from_cell), from_cell, to_cell))
+            assert found == expected
+            before[index] = (layers, color_index, expected)
+
+        games.step_random()
+        for index, (layers, color_index, expected) in before.items():
+            after = games.game_layers(index)
+            state = int(games.state[index])
+            if not expected:
+                assert after == layers and state == batch.DRAW
+                continue
+            assert after in {play_move(layers, color_index, move) for move in expected}
+            if outcome(after) is None:
+                assert state == batch.ONGOING and games.side[index] == 1 - color_index
+            else:
+                assert states[state] == outcome(after)
@@ -0,0 +1,76 @@
+# pylint: disable=no-member
+# pylint: disable=too-many-branches
+"""
+Gobblet Jr. Board Game - Headless Tournament Runner.
+
+Plays computer players against each other in worker processes, with no
+window, and rates them with Elo.
+
+Players are given as specs, e.g.:
+    python3 tournament.py random alphabeta:time=0.05 mcts:time=0.05,playouts=2000
+
+Swiss rounds instead of a round robin:
+    python3 tournament.py random alphabeta:depth=2 alphabeta:depth=4 --format swiss --rounds 5
+"""
+
+import argparse
+import sys
+from src.ai.tournament import Tournament, MAX_GAME_PLIES
+
+def parse_args(argv):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Gobblet Jr. computer player tournament")
+    parser.add_argument("players", nargs="+",
+                        help="player specs: random, alphabeta:time=T,depth=D, "
+                             "mcts:time=T,playouts=N,workers=W or table:path=FILE")
+    parser.add_argument("--format", choices=["roundrobin", "swiss"], default="roundrobin",
+                        help="tournament format")
+    parser.add_argument("--games", type=int, default=10,
+                        help="games per pair in a round robin")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="rounds in a Swiss tournament")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--max-plies", type=int, default=MAX_GAME_PLIES,
+                        help="plies before a game is scored as a draw")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed for the players' random choices")
+    args = parser.parse_args(argv)
+    if len(set(args.players)) != len(args.players):
+        parser.error("player specs must be distinct")
+    if len(args.players) < 2:
+        parser.error("at least two players are needed")
+    return args
+
+def print_result(result):
+    """
+    Print one finished game.
+    """
+    game_id, red, blue, red_score, plies = result
+    outcome = {1.0: "red wins", 0.0: "blue wins"}.get(red_score, "draw")
+    print(f"game {game_id:4d}: {red} (red) vs {blue} (blue): {outcome} in {plies} plies",
+          flush=True)
+
+def main(argv=None):
+    """
+    Main entry point function.
+    """
+    args = parse_args(argv)
+    tournament = Tournament(args.players, args.processes, args.max_plies, args.seed)
+    if args.format == "swiss":
+        tournament.run_swiss(args.rounds, print_result)
+    else:
+        tournament.run_round_robin(args.games, print_result)
+
+    # Print the standings
+    width = max(len(spec) for spec in args.players)
+    print()
+    print(f"{'player':<{width}}  games  score     elo")
+    for spec, games, score, rating, interval in tournament.standings():
+        print(f"{spec:<{width}}  {games:5d}  {score:5.1f}  {rating:+6.0f} +/- {interval:.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())